@@ -37,6 +37,21 @@ def get_bundle_path(relative_path: str) -> str:
         logger.debug(f"Running in development. Path: {full_path}")
         return full_path
 
+def get_user_cache_path(relative_path: str) -> str:
+    """
+    Per-user cache location. Unlike get_bundle_path this stays writable in a
+    frozen build, whose bundle (e.g. macOS Resources/) is read-only or signed.
+    """
+    if sys.platform == 'darwin':
+        base_dir = os.path.join(os.path.expanduser('~'), 'Library', 'Caches', 'THORUS-Terminal')
+    elif sys.platform == 'win32':
+        local_app_data = os.getenv('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        base_dir = os.path.join(local_app_data, 'THORUS-Terminal', 'Cache')
+    else:
+        xdg_cache = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        base_dir = os.path.join(xdg_cache, 'thorus-terminal')
+    return os.path.join(base_dir, relative_path)
+
 def ensure_paths_exist():
     """Ensure all required paths exist"""
     required_paths = [
@@ -114,6 +129,10 @@ def load_config() -> Dict[str, Any]:
             'anthropic': os.getenv('ANTHROPIC_API_KEY')  # Alias for claude
         },
         'voice_model': os.getenv('ELEVENLABS_MODEL', 'eleven_flash_v2_5'),
+        'voice_cache': {
+            'dir': get_user_cache_path('tts'),
+            'max_mb': int(os.getenv('VOICE_CACHE_MAX_MB', '100'))
+        },
         'ui': {
             'theme': os.getenv('UI_THEME', 'dark')
         },
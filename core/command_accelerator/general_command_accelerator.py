@@ -1,8 +1,12 @@
 import aiohttp
 import json
 import logging
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 
+# Enhanced commands kept for repeats (least recently used evicted first)
+ENHANCE_CACHE_SIZE = 128
+
 class GeneralCommandAccelerator:
     """General command accelerator that uses GPT-4o-mini to enhance command prompts"""
     
@@ -11,9 +15,24 @@ class GeneralCommandAccelerator:
         if not self.api_key:
             raise ValueError("OpenAI API key not found in configuration")
         self.logger = logging.getLogger('CryptoAnalyzer.CommandAccelerator')
-        
+        self._cache = OrderedDict()
+
     async def enhance_command(self, command: str) -> Optional[str]:
-        """Enhance a command using GPT-4o-mini"""
+        """Enhance a command using GPT-4o-mini, reusing the result for repeated commands"""
+        cached = self._cache.get(command)
+        if cached is not None:
+            self._cache.move_to_end(command)
+            self.logger.debug("Enhanced command cache hit")
+            return cached
+
+        enhanced_command = await self._request_enhancement(command)
+        if enhanced_command:
+            self._cache[command] = enhanced_command
+            if len(self._cache) > ENHANCE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return enhanced_command
+
+    async def _request_enhancement(self, command: str) -> Optional[str]:
         try:
             async with aiohttp.ClientSession() as session:
                 headers = {
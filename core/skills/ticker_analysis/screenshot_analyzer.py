@@ -115,7 +115,8 @@ class ScreenshotAnalyzer:
             """
             
             print("Sending image to Gemini for analysis...")
-            response = self.model.generate_content([prompt, image])
+            # Async variant so the shared loop keeps serving TTS/commands meanwhile
+            response = await self.model.generate_content_async([prompt, image])
             print(f"Gemini analysis took {time.time() - start_time:.2f} seconds")
             
             try:
@@ -136,7 +137,8 @@ class ScreenshotAnalyzer:
                     await crypto_analyzer.close()
                     return
 
-                # Process tokens
+                # Process tokens, collecting market data for one batched AI analysis
+                pending_analyses = []
                 for token in extracted_data.get("tokens", []):
                     try:
                         symbol = token.get("symbol", "").replace("$", "").strip()
@@ -159,6 +161,7 @@ class ScreenshotAnalyzer:
 
                         # Prepare analysis data
                         analysis_data = {
+                            'symbol': symbol,
                             'chain': dex_data['chainId'],
                             'price': dex_data['priceUsd'],
                             'marketCap': dex_data['marketCap'],
@@ -173,37 +176,49 @@ class ScreenshotAnalyzer:
 
                         if "location" in token:
                             print(f"Token location data found for {symbol}")
-                        
-                        # Get AI analysis
-                        try:
-                            print(f"Getting AI analysis for {symbol}...")
-                            
-                            ai_analysis = await crypto_analyzer.get_ai_analysis(analysis_data)
-                            if ai_analysis:
-                                print(f"\n{symbol} Final Analysis:")
-                                print(ai_analysis)
-                                
-                                # Show full analysis in notification
-                                notification.show_message(ai_analysis)
-                                
-                                # Only send recommendation and reason to voice
-                                voice_text = self._extract_voice_text(ai_analysis)
-                                if voice_text:
-                                    await voice_handler.generate_and_play(voice_text, symbol)
-                                
-                            else:
-                                print("No AI analysis generated")
-                                
-                        except Exception as e:
-                            self.logger.error(f"AI analysis failed: {str(e)}")
-                            print(f"AI analysis error: {str(e)}")
-                            continue
+
+                        pending_analyses.append((symbol, analysis_data))
                             
                     except Exception as e:
                         self.logger.error(f"Error processing token {symbol}: {str(e)}")
                         print(f"Token processing error: {str(e)}")
                         continue
 
+                # Get AI analysis for every token in as few requests as possible
+                analyses = []
+                if pending_analyses:
+                    try:
+                        symbols = ', '.join(symbol for symbol, _ in pending_analyses)
+                        print(f"Getting AI analysis for {symbols}...")
+                        analyses = await crypto_analyzer.get_ai_analyses(
+                            [analysis_data for _, analysis_data in pending_analyses]
+                        )
+                    except Exception as e:
+                        self.logger.error(f"AI analysis failed: {str(e)}")
+                        print(f"AI analysis error: {str(e)}")
+
+                for (symbol, _), ai_analysis in zip(pending_analyses, analyses):
+                    try:
+                        if ai_analysis:
+                            print(f"\n{symbol} Final Analysis:")
+                            print(ai_analysis)
+                            
+                            # Show full analysis in notification
+                            notification.show_message(ai_analysis)
+                            
+                            # Only send recommendation and reason to voice
+                            voice_text = self._extract_voice_text(ai_analysis)
+                            if voice_text:
+                                await voice_handler.generate_and_play(voice_text, symbol)
+                            
+                        else:
+                            print("No AI analysis generated")
+                            
+                    except Exception as e:
+                        self.logger.error(f"AI analysis failed: {str(e)}")
+                        print(f"AI analysis error: {str(e)}")
+                        continue
+
             except json.JSONDecodeError as e:
                 self.logger.error(f"JSON parsing error: {str(e)}")
                 print("Failed to parse Gemini response as JSON:", str(e))
@@ -1,48 +1,108 @@
 import google.generativeai as genai
+import asyncio
 import logging
+import re
 import time
-import json
+from collections import namedtuple
+import ijson
+import orjson
 import aiohttp
 import ssl
 import certifi
-from openai import OpenAI
+from openai import AsyncOpenAI
 from ...avatar.events import AvatarObserver
 from ...avatar.models import Avatar
 
+# Tokens analyzed per OpenAI request, and how many of those requests may run at once
+ANALYSIS_BATCH_SIZE = 8
+MAX_CONCURRENT_ANALYSES = 8
+ANALYSIS_SEPARATOR = "---"
+# Header each analysis starts with (see _build_system_prompt); names the token it covers
+ANALYSIS_HEADER_RE = re.compile(r'ANALYSIS FOR\s+\$?([^\s:]+)', re.IGNORECASE)
+
+# Running result of filtering a DEXScreener pairs stream
+PairScan = namedtuple('PairScan', ['best_pair', 'best_liq', 'pairs_count', 'valid_count', 'total_liquidity'])
+EMPTY_PAIR_SCAN = PairScan(None, 0.0, 0, 0, 0.0)
+
 class CryptoAnalyzer(AvatarObserver):
+    # Parsing the certifi bundle is slow, so one context is shared by every session
+    _SSL_CONTEXT = None
+
     def __init__(self, config):
         self.dex_cache = {}
         self.cache_duration = 300  # 5 minutes
         self.session = None
+        self._session_loop = None
         self.logger = logging.getLogger('CryptoAnalyzer.Core')
         self.perf_logger = logging.getLogger('CryptoAnalyzer.Performance')
         
         # Store the current analysis style and personality
         self._analysis_style = ""
         self._personality = ""
+        self._system_prompt = self._build_system_prompt()
         
         # Initialize APIs using config
         genai.configure(api_key=config['api_keys']['gemini'])
-        self.openai_client = OpenAI(api_key=config['api_keys']['openai'])
+        self.openai_client = AsyncOpenAI(api_key=config['api_keys']['openai'])
 
     def on_avatar_changed(self, avatar: Avatar) -> None:
         """Update analysis style and personality when avatar changes"""
         self._analysis_style = avatar.get_prompt('analysis')
         self._personality = avatar.get_prompt('personality')
+        self._system_prompt = self._build_system_prompt()
         self.logger.info(f"Analysis style and personality updated for avatar: {avatar.name}")
 
+    def _build_system_prompt(self):
+        """Template the analysis system prompt for the current personality and style"""
+        return f"""You are an expert crypto analyst with the following personality and analysis style:
+
+    PERSONALITY:
+    {self._personality}
+
+    ANALYSIS APPROACH:
+    {self._analysis_style}
+
+    Your goal is to provide a structured analysis in exactly this format:
+    Write your analysis following the personality and approach described above. Determine if you should ape or you should hold a bit. Only reply with one choice and the symbol.
+
+    ANALYSIS FOR [insert token ticker symbol]:
+
+    🟢 Yes. I would ape! or 🔴 I would hold a bit
+    [2 short sentences max]
+
+    MC: $[value]
+
+    Rules:
+    • Use exact numeric values from the data
+    • Use "N/A" for missing values
+    - Don't include brackets around the token ticker symbol
+    - Don't put specific numbers or symbols in the reason. The reason should be a normal alphabetical sentence without numbers or symbols
+    • Use 🟢 for I would Ape, 🔴 for I would hold a bit and also put the word to the right of the symbol
+    • Format must match exactly as shown
+    """
+
     async def init_session(self):
         """Initialize or reinitialize the session if needed"""
+        loop = asyncio.get_running_loop()
+        if self.session and not self.session.closed and self._session_loop is not loop:
+            # aiohttp sessions are bound to the loop that created them; hand the
+            # stale one back to its own loop to close and start a fresh one here
+            self.logger.debug("Session belongs to another event loop, creating new session")
+            if self._session_loop and self._session_loop.is_running():
+                asyncio.run_coroutine_threadsafe(self.session.close(), self._session_loop)
+            self.session = None
+
         if self.session is None or self.session.closed:
             if self.session and self.session.closed:
                 self.logger.debug("Previous session was closed, creating new session")
             
             # Configure SSL context with certifi certificates
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            if CryptoAnalyzer._SSL_CONTEXT is None:
+                CryptoAnalyzer._SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
             
             # Configure connection with SSL context
             connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
+                ssl=CryptoAnalyzer._SSL_CONTEXT,
                 limit=10,  # Connection pool limit
                 ttl_dns_cache=300  # DNS cache TTL
             )
@@ -54,9 +114,24 @@ class CryptoAnalyzer(AvatarObserver):
                     'Accept': 'application/json'
                 }
             )
+            self._session_loop = loop
             self.logger.debug("Initialized new aiohttp session with SSL context")
         return self.session
 
+    async def warmup(self):
+        """
+        Open the session and preconnect to DexScreener so the first real lookup
+        skips connector setup, DNS resolution and the TLS handshake.
+        """
+        start_time = time.monotonic()
+        try:
+            session = await self.init_session()
+            async with session.head("https://api.dexscreener.com/") as response:
+                await response.release()
+            self.perf_logger.debug("DEX_WARMUP|duration=%.3fs", time.monotonic() - start_time)
+        except Exception as e:
+            self.logger.debug(f"DexScreener warmup failed: {str(e)}")
+
     async def close(self):
         """Close the aiohttp session"""
         if self.session and not self.session.closed:
@@ -64,10 +139,103 @@ class CryptoAnalyzer(AvatarObserver):
             self.session = None  # Set to None after closing
             self.logger.debug("Closed aiohttp session")
 
+    @staticmethod
+    def _looks_like_address(identifier):
+        """Heuristic check for a contract address (base58/hex) rather than a ticker"""
+        candidate = identifier.strip()
+        return len(candidate) >= 32 and '$' not in candidate and candidate.isalnum()
+
+    def _scan_pair(self, scan, pair, target_symbol):
+        """Fold one DEXScreener pair into `scan`, keeping only the highest liquidity match"""
+        pairs_count = scan.pairs_count + 1
+        liquidity_usd = (pair.get('liquidity') or {}).get('usd')
+        base_symbol = ((pair.get('baseToken') or {}).get('symbol') or '').upper()
+        quote_symbol = ((pair.get('quoteToken') or {}).get('symbol') or '').upper()
+
+        self.logger.debug("Checking pair: %s/%s - Liquidity: %s", base_symbol, quote_symbol, liquidity_usd)
+
+        # Check if this pair matches our token (either as base or quote)
+        symbol_match = (base_symbol == target_symbol or
+                        quote_symbol == target_symbol)
+
+        if not (liquidity_usd and
+                symbol_match and
+                pair.get('priceUsd') and
+                pair.get('marketCap')):
+            return scan._replace(pairs_count=pairs_count)
+
+        try:
+            liq_float = float(liquidity_usd)
+            self.logger.debug(
+                f"Added valid pair: {base_symbol}/{quote_symbol} "
+                f"on {pair['chainId']}, Liquidity: ${liq_float:,.2f}, "
+                f"Price: ${float(pair['priceUsd']):,.6f}"
+            )
+        except (ValueError, TypeError) as e:
+            self.logger.error(f"Error processing liquidity: {e}")
+            return scan._replace(pairs_count=pairs_count)
+
+        scan = scan._replace(
+            pairs_count=pairs_count,
+            valid_count=scan.valid_count + 1,
+            total_liquidity=scan.total_liquidity + liq_float
+        )
+        if scan.best_pair is None or liq_float > scan.best_liq:
+            scan = scan._replace(best_pair=pair, best_liq=liq_float)
+        return scan
+
+    async def _fetch_pairs(self, session, url, label, target_symbol):
+        """
+        Request a DEXScreener URL and stream its pairs through the symbol/liquidity
+        filter without materializing the response. Returns a PairScan (None on HTTP error).
+        """
+        self.logger.debug(f"Requesting URL: {url}")
+        request_start = time.monotonic()
+        async with session.get(url) as response:
+            request_duration = time.monotonic() - request_start
+            self.perf_logger.debug("%s|duration=%.3fs", label, request_duration)
+
+            if response.status != 200:
+                self.logger.error(f"DEXScreener API error: {response.status}")
+                return None
+
+            scan = EMPTY_PAIR_SCAN
+            pairs_start = time.monotonic()
+            async for pair in ijson.items(response.content, 'pairs.item', use_float=True):
+                scan = self._scan_pair(scan, pair, target_symbol)
+
+            self.perf_logger.debug(
+                "DEX_PAIRS_PROCESSING|pairs_count=%d|valid_pairs=%d|duration=%.3fs",
+                scan.pairs_count, scan.valid_count, time.monotonic() - pairs_start
+            )
+            return scan
+
+    async def _fetch_first_pairs(self, session, requests, target_symbol):
+        """Race several DEXScreener requests and return the first scan that saw any pairs"""
+        tasks = [
+            asyncio.ensure_future(self._fetch_pairs(session, url, label, target_symbol))
+            for url, label in requests
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    scan = await next_done
+                except Exception as e:
+                    self.logger.debug(f"Concurrent DEXScreener request failed: {e}")
+                    continue
+                if scan and scan.pairs_count:
+                    return scan
+            return EMPTY_PAIR_SCAN
+        finally:
+            # Release the slower request's connection back to the pool
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     async def get_dex_data(self, identifier):
         """Fetch data from DEXScreener using either ticker or contract address"""
-        start_time = time.time()
-        self.perf_logger.info(f"DEX_FETCH_START|identifier={identifier}")
+        start_time = time.monotonic()
+        self.perf_logger.info("DEX_FETCH_START|identifier=%s", identifier)
         
         try:
             self.logger.info(f"Fetching DEXScreener data for: {identifier}")
@@ -75,110 +243,63 @@ class CryptoAnalyzer(AvatarObserver):
 
             # Clean the identifier (remove $ and whitespace)
             clean_identifier = identifier.replace('$', '').strip()
+            target_symbol = clean_identifier.upper()
             url = f"https://api.dexscreener.com/latest/dex/search?q={clean_identifier}"
-            
-            self.logger.debug(f"Requesting URL: {url}")
-            
-            request_start = time.time()
-            async with session.get(url) as response:
-                request_duration = time.time() - request_start
-                self.perf_logger.debug(f"DEX_API_REQUEST|duration={request_duration:.3f}s")
-                
-                if response.status != 200:
-                    self.logger.error(f"DEXScreener API error: {response.status}")
-                    self.perf_logger.error(f"DEX_FETCH_ERROR|identifier={identifier}|status={response.status}|duration={time.time()-start_time:.3f}s")
+            fallback_url = f"https://api.dexscreener.com/latest/dex/tokens/{identifier}"
+
+            if self._looks_like_address(identifier):
+                # Contract addresses usually miss on search, so fire both at once
+                scan = await self._fetch_first_pairs(session, [
+                    (url, "DEX_API_REQUEST"),
+                    (fallback_url, "DEX_FALLBACK_REQUEST")
+                ], target_symbol)
+            else:
+                scan = await self._fetch_pairs(session, url, "DEX_API_REQUEST", target_symbol)
+                if scan is None:
+                    self.perf_logger.error(f"DEX_FETCH_ERROR|identifier={identifier}|result=http_error|duration={time.monotonic()-start_time:.3f}s")
                     return None
 
-                data = await response.json()
-                pairs = data.get('pairs', [])
-                
-                self.logger.debug(f"Found {len(pairs)} total pairs in response")
-                
-                if not pairs:
+                self.logger.debug(f"Found {scan.pairs_count} total pairs in response")
+
+                if not scan.pairs_count:
                     self.logger.warning(f"No pairs found for {identifier}")
                     # Try fallback to contract address if no pairs found
-                    fallback_url = f"https://api.dexscreener.com/latest/dex/tokens/{identifier}"
-                    
-                    fallback_start = time.time()
-                    async with session.get(fallback_url) as fallback_response:
-                        fallback_duration = time.time() - fallback_start
-                        self.perf_logger.debug(f"DEX_FALLBACK_REQUEST|duration={fallback_duration:.3f}s")
-                        
-                        if fallback_response.status == 200:
-                            fallback_data = await fallback_response.json()
-                            pairs = fallback_data.get('pairs', [])
-                            self.logger.debug(f"Fallback search found {len(pairs)} pairs")
-                        if not pairs:
-                            self.perf_logger.info(f"DEX_FETCH_END|identifier={identifier}|result=no_pairs|duration={time.time()-start_time:.3f}s")
-                            return None
-
-                # Filter and get valid pairs with liquidity
-                valid_pairs = []
-                total_liquidity = 0
-                
-                pairs_start = time.time()
-                for pair in pairs:
-                    liquidity_usd = pair.get('liquidity', {}).get('usd')
-                    base_symbol = pair.get('baseToken', {}).get('symbol', '').upper()
-                    quote_symbol = pair.get('quoteToken', {}).get('symbol', '').upper()
-                    
-                    self.logger.debug(f"Checking pair: {base_symbol}/{quote_symbol} - Liquidity: {liquidity_usd}")
-                    
-                    # Check if this pair matches our token (either as base or quote)
-                    symbol_match = (base_symbol == clean_identifier.upper() or 
-                                    quote_symbol == clean_identifier.upper())
-                    
-                    if (liquidity_usd and 
-                        symbol_match and
-                        pair.get('priceUsd') and 
-                        pair.get('marketCap')):
-                        try:
-                            liq_float = float(liquidity_usd)
-                            total_liquidity += liq_float
-                            valid_pairs.append(pair)
-                            self.logger.debug(
-                                f"Added valid pair: {base_symbol}/{quote_symbol} "
-                                f"on {pair['chainId']}, Liquidity: ${liq_float:,.2f}, "
-                                f"Price: ${float(pair['priceUsd']):,.6f}"
-                            )
-                        except (ValueError, TypeError) as e:
-                            self.logger.error(f"Error processing liquidity: {e}")
-                            continue
-
-                pairs_duration = time.time() - pairs_start
-                self.perf_logger.debug(f"DEX_PAIRS_PROCESSING|pairs_count={len(pairs)}|valid_pairs={len(valid_pairs)}|duration={pairs_duration:.3f}s")
-
-                if not valid_pairs:
-                    self.logger.warning(
-                        f"No valid pairs found for {identifier} after filtering"
-                    )
-                    self.perf_logger.info(f"DEX_FETCH_END|identifier={identifier}|result=no_valid_pairs|duration={time.time()-start_time:.3f}s")
-                    return None
+                    scan = await self._fetch_pairs(session, fallback_url, "DEX_FALLBACK_REQUEST", target_symbol) or EMPTY_PAIR_SCAN
+                    self.logger.debug(f"Fallback search found {scan.pairs_count} pairs")
 
-                # Get highest liquidity pair
-                best_pair = max(valid_pairs, key=lambda x: float(x['liquidity']['usd']))
-                
-                self.logger.info(
-                    f"Selected best pair for {identifier}: "
-                    f"{best_pair['baseToken']['symbol']}/{best_pair['quoteToken']['symbol']} "
-                    f"on {best_pair['chainId']} ({best_pair['dexId']}), "
-                    f"Liquidity: ${float(best_pair['liquidity']['usd']):,.2f} "
-                    f"({(float(best_pair['liquidity']['usd'])/total_liquidity*100):.1f}% of total liquidity)"
+            if not scan.pairs_count:
+                self.perf_logger.info("DEX_FETCH_END|identifier=%s|result=no_pairs|duration=%.3fs", identifier, time.monotonic()-start_time)
+                return None
+
+            best_pair, best_liq = scan.best_pair, scan.best_liq
+            if best_pair is None:
+                self.logger.warning(
+                    f"No valid pairs found for {identifier} after filtering"
                 )
+                self.perf_logger.info("DEX_FETCH_END|identifier=%s|result=no_valid_pairs|duration=%.3fs", identifier, time.monotonic()-start_time)
+                return None
+            
+            self.logger.info(
+                f"Selected best pair for {identifier}: "
+                f"{best_pair['baseToken']['symbol']}/{best_pair['quoteToken']['symbol']} "
+                f"on {best_pair['chainId']} ({best_pair['dexId']}), "
+                f"Liquidity: ${best_liq:,.2f} "
+                f"({(best_liq/scan.total_liquidity*100):.1f}% of total liquidity)"
+            )
 
-                end_time = time.time()
-                duration = end_time - start_time
+            end_time = time.monotonic()
+            duration = end_time - start_time
+            # %-style has no thousands separator, so the value is pre-formatted,
+            # but only when the record will actually be emitted
+            if self.perf_logger.isEnabledFor(logging.INFO):
                 self.perf_logger.info(
-                    f"DEX_FETCH_END|identifier={identifier}|"
-                    f"chain={best_pair['chainId']}|"
-                    f"dex={best_pair['dexId']}|"
-                    f"liquidity=${float(best_pair['liquidity']['usd']):,.2f}|"
-                    f"duration={duration:.3f}s"
+                    "DEX_FETCH_END|identifier=%s|chain=%s|dex=%s|liquidity=$%s|duration=%.3fs",
+                    identifier, best_pair['chainId'], best_pair['dexId'], f"{best_liq:,.2f}", duration
                 )
-                return best_pair
+            return best_pair
 
         except Exception as e:
-            end_time = time.time()
+            end_time = time.monotonic()
             duration = end_time - start_time
             self.logger.error(f"Error in DEXScreener data fetch: {str(e)}", exc_info=True)
             self.perf_logger.error(f"DEX_FETCH_ERROR|identifier={identifier}|error={str(e)}|duration={duration:.3f}s")
@@ -186,77 +307,115 @@ class CryptoAnalyzer(AvatarObserver):
 
     async def get_ai_analysis(self, analysis_data):
         """Get AI analysis using OpenAI GPT-4 with notification-optimized format."""
-        start_time = time.time()
-        self.perf_logger.info("OPENAI_ANALYSIS_START")
-        
-        try:
-            self.logger.info("Starting OpenAI analysis")
-            
-            # Updated system prompt incorporating avatar personality and analysis style
-            system_prompt = f"""You are an expert crypto analyst with the following personality and analysis style:
+        return (await self.get_ai_analyses([analysis_data]))[0]
 
-    PERSONALITY:
-    {self._personality}
+    async def get_ai_analyses(self, data_list):
+        """
+        Analyze several tokens with as few OpenAI round-trips as possible.
+        Returns one analysis (or None) per input, in input order.
+        """
+        batches = [
+            data_list[i:i + ANALYSIS_BATCH_SIZE]
+            for i in range(0, len(data_list), ANALYSIS_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
 
-    ANALYSIS APPROACH:
-    {self._analysis_style}
-
-    Your goal is to provide a structured analysis in exactly this format:
-    Write your analysis following the personality and approach described above. Determine if you should ape or you should hold a bit. Only reply with one choice and the symbol.
+        async def run_batch(batch):
+            async with semaphore:
+                return await self._request_analyses(batch)
 
-    ANALYSIS FOR [insert token ticker symbol]:
+        results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+        return [analysis for batch_result in results for analysis in batch_result]
 
-    🟢 Yes. I would ape! or 🔴 I would hold a bit
-    [2 short sentences max]
-
-    MC: $[value]
-
-    Rules:
-    • Use exact numeric values from the data
-    • Use "N/A" for missing values
-    - Don't include brackets around the token ticker symbol
-    - Don't put specific numbers or symbols in the reason. The reason should be a normal alphabetical sentence without numbers or symbols
-    • Use 🟢 for I would Ape, 🔴 for I would hold a bit and also put the word to the right of the symbol
-    • Format must match exactly as shown
-    """
-
-            # Updated user prompt with minimal data structure
-            user_prompt = f"""
+    async def _request_analyses(self, batch):
+        """Run a single OpenAI request covering every token in `batch`."""
+        start_time = time.monotonic()
+        self.perf_logger.info("OPENAI_ANALYSIS_START|batch_size=%d", len(batch))
+        
+        try:
+            self.logger.info(f"Starting OpenAI analysis for {len(batch)} token(s)")
+            
+            if len(batch) == 1:
+                # Updated user prompt with minimal data structure
+                user_prompt = f"""
     Here is the token data in JSON format (use only these values exactly):
-    {json.dumps(analysis_data, indent=4)}
+    {orjson.dumps(batch[0]).decode()}
 
     Please provide analysis in the exact format specified, matching the template precisely.
+    """
+            else:
+                user_prompt = f"""
+    Here is the data for {len(batch)} tokens in JSON format (use only these values exactly):
+    {orjson.dumps({"tokens": batch}).decode()}
+
+    Provide one analysis per token, in the same order as the input, each in the exact format specified.
+    Separate consecutive analyses with a line containing only {ANALYSIS_SEPARATOR}
     """
 
             # Make the API call
-            completion = self.openai_client.chat.completions.create(
+            completion = await self.openai_client.chat.completions.create(
                 model="gpt-4o",
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": self._system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.7,
-                max_tokens=200,
+                max_tokens=200 * len(batch),
                 top_p=0.9
             )
             
             if completion.choices:
                 analysis = completion.choices[0].message.content.strip()
                 self.logger.info(f"Generated analysis: {analysis}")
+
+                if len(batch) == 1:
+                    analyses = [analysis]
+                else:
+                    analyses = [part.strip() for part in analysis.split(ANALYSIS_SEPARATOR) if part.strip()]
+                    if len(analyses) != len(batch):
+                        self.logger.warning(
+                            f"Expected {len(batch)} analyses in batched response, got {len(analyses)}"
+                        )
+                        analyses = await self._match_analyses(batch, analyses)
                 
-                end_time = time.time()
+                end_time = time.monotonic()
                 total_duration = end_time - start_time
-                self.perf_logger.info(f"OPENAI_ANALYSIS_END|status=completed|duration={total_duration:.3f}s")
+                self.perf_logger.info("OPENAI_ANALYSIS_END|status=completed|batch_size=%d|duration=%.3fs", len(batch), total_duration)
 
-                return analysis
+                return analyses
             else:
                 self.logger.error("No completion choices returned")
-                self.perf_logger.error(f"OPENAI_ANALYSIS_ERROR|error=no_choices|duration={time.time()-start_time:.3f}s")
-                return None
+                self.perf_logger.error(f"OPENAI_ANALYSIS_ERROR|error=no_choices|duration={time.monotonic()-start_time:.3f}s")
+                return [None] * len(batch)
 
         except Exception as e:
-            end_time = time.time()
+            end_time = time.monotonic()
             duration = end_time - start_time
             self.logger.error(f"Error in OpenAI analysis: {str(e)}", exc_info=True)
             self.perf_logger.error(f"OPENAI_ANALYSIS_ERROR|error={str(e)}|duration={duration:.3f}s")
-            return None
\ No newline at end of file
+            return [None] * len(batch)
+
+    async def _match_analyses(self, batch, sections):
+        """
+        Pair sections of a miscounted batched response with their tokens by the
+        "ANALYSIS FOR <symbol>" header; tokens left without one are re-requested alone.
+        Position is never trusted here, since a missing or extra section shifts it.
+        """
+        by_symbol = {}
+        for section in sections:
+            match = ANALYSIS_HEADER_RE.search(section)
+            if match:
+                by_symbol.setdefault(match.group(1).upper(), section)
+
+        analyses = []
+        for data in batch:
+            symbol = str(data.get('symbol', '')).replace('$', '').strip().upper()
+            analyses.append(by_symbol.pop(symbol, None) if symbol else None)
+
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+        if missing:
+            self.logger.info(f"Re-requesting {len(missing)} unmatched analyses individually")
+            retries = await asyncio.gather(*(self._request_analyses([batch[i]]) for i in missing))
+            for i, (analysis,) in zip(missing, retries):
+                analyses[i] = analysis
+        return analyses
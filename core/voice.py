@@ -1,34 +1,88 @@
-from elevenlabs import ElevenLabs
+from elevenlabs import AsyncElevenLabs
+import aiofiles
 import logging
-from datetime import datetime
 import time
 import os
 import platform
 import asyncio
 import threading
-import queue
-import uuid
 import signal
+import hashlib
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from .avatar.events import AvatarObserver
 from .avatar.models import Avatar
 
+if platform.system() == "Darwin":
+    try:
+        from Foundation import NSObject
+
+        class _PlaybackDelegate(NSObject):
+            """AVAudioPlayer delegate that reports playback completion to a callback."""
+
+            def audioPlayerDidFinishPlaying_successfully_(self, player, flag):
+                callback = getattr(self, 'on_finish', None)
+                if callback:
+                    callback()
+    except ImportError:
+        _PlaybackDelegate = None
+else:
+    _PlaybackDelegate = None
+
+# Command-line players tried for fallback playback, in order of preference
+FALLBACK_PLAYERS = [
+    ['afplay', '-r', '1.1'],
+    ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet', '-af', 'atempo=1.1'],
+    ['mpg123', '-q'],
+]
+
 class VoiceHandler(AvatarObserver):
-    def __init__(self, config, avatar_manager=None):
+    def __init__(self, config, avatar_manager=None, voice_loop=None):
         self.logger = logging.getLogger('CryptoAnalyzer.Voice')
         self.perf_logger = logging.getLogger('CryptoAnalyzer.Performance')
-        self.elevenlabs_client = ElevenLabs(api_key=config['api_keys']['elevenlabs'])
+        self.elevenlabs_client = AsyncElevenLabs(api_key=config['api_keys']['elevenlabs'])
+
+        # TTS generation and playback both run as coroutines on this loop.
+        # Without a shared voice loop we run a private one.
+        self._owns_loop = voice_loop is None
+        if self._owns_loop:
+            voice_loop = asyncio.new_event_loop()
+            threading.Thread(target=voice_loop.run_forever, name="VoiceLoop", daemon=True).start()
+        self.loop = voice_loop
 
         # Voice ID will be set from the avatar system
         self.voice_id = None
         self.voice_model = config.get('voice_model', 'eleven_flash_v2_5')
 
+        # On-disk TTS cache keyed by (voice, model, text) so repeated phrases skip ElevenLabs
+        cache_cfg = config.get('voice_cache', {})
+        self._tts_cache_dir = cache_cfg.get('dir', os.path.join('cache', 'tts'))
+        self._tts_cache_max_bytes = cache_cfg.get('max_mb', 100) * 1024 * 1024
+        try:
+            os.makedirs(self._tts_cache_dir, exist_ok=True)
+        except OSError as e:
+            # Unwritable location: synthesize every time rather than fail construction
+            self.logger.warning(f"TTS disk cache disabled, cannot create {self._tts_cache_dir}: {str(e)}")
+            self._tts_cache_dir = None
+
+        # Blocking playback (playsound holds a worker per clip) and cache eviction get their
+        # own small pool, so they never tie up the loop's default executor that aiofiles
+        # writes and aiohttp DNS lookups share
+        self._blocking_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='voice-io')
+
+        # Uncached speech files live in a private temp dir that cleanup removes wholesale
+        self._tts_dir = tempfile.mkdtemp(prefix='thorus_tts_')
+
         # Track current playback
         self._current_player = None
+        self._player_delegate = None
+        self._playback_done = None
         self._current_process = None
         self._cancelled = False
 
-        # Track in-progress TTS generations (avoid duplicates)
+        # Track in-progress TTS generations by text digest (avoid duplicates)
         self._generating_texts = set()
         self._generating_lock = threading.Lock()
 
@@ -62,17 +116,15 @@ class VoiceHandler(AvatarObserver):
         else:
             self.use_avfoundation = False
 
-        # Single-thread playback => no overlapping audio
-        self._playback_queue = queue.Queue()
-        self._stop_playback_thread = False
-
-        # Start up the playback thread
-        self._playback_thread = threading.Thread(
-            target=self._playback_worker,
-            name="VoicePlaybackWorker",
-            daemon=True
+        # Command-line player for the fallback path (None => playsound)
+        self._fallback_player = next(
+            (cmd for cmd in FALLBACK_PLAYERS if shutil.which(cmd[0])), None
         )
-        self._playback_thread.start()
+
+        # Single playback task => no overlapping audio
+        self._playback_queue = asyncio.Queue()
+        self._stop_playback = False
+        self._playback_task = asyncio.run_coroutine_threadsafe(self._playback_worker(), self.loop)
 
     def cancel_all(self):
         """
@@ -118,12 +170,17 @@ class VoiceHandler(AvatarObserver):
 
     def clear_queue(self):
         """Clear pending audio files from the playback queue."""
-        try:
-            while not self._playback_queue.empty():
+        self.loop.call_soon_threadsafe(self._drain_playback_queue)
+
+    def _drain_playback_queue(self):
+        """Drop queued audio files; must run on the voice loop."""
+        # Only mark items done once they were actually dequeued, so join() stays balanced
+        while True:
+            try:
                 self._playback_queue.get_nowait()
-                self._playback_queue.task_done()
-        except Exception as e:
-            self.logger.error(f"Error clearing voice queue: {e}")
+            except asyncio.QueueEmpty:
+                break
+            self._playback_queue.task_done()
 
     def stop_current_playback(self):
         """Stop any currently playing audio."""
@@ -132,10 +189,15 @@ class VoiceHandler(AvatarObserver):
             if self.use_avfoundation and self._current_player:
                 self._current_player.stop()
                 self._current_player = None
-            # Otherwise if on macOS fallback or other platforms:
-            elif platform.system() == "Darwin" and self._current_process:
+                # stop() doesn't fire the delegate, so release the waiting playback task
+                self.loop.call_soon_threadsafe(self._finish_playback)
+            # Otherwise stop the fallback player process:
+            elif self._current_process:
                 try:
-                    os.killpg(os.getpgid(self._current_process.pid), signal.SIGTERM)
+                    if hasattr(os, 'killpg'):
+                        os.killpg(os.getpgid(self._current_process.pid), signal.SIGTERM)
+                    else:
+                        self._current_process.terminate()
                 except:
                     pass
                 self._current_process = None
@@ -160,31 +222,36 @@ class VoiceHandler(AvatarObserver):
             self.logger.debug("generate_and_play_background() -> skip because _cancelled is True")
             return
 
+        text_key = self._text_key(text)
         with self._generating_lock:
-            if text in self._generating_texts:
+            if text_key in self._generating_texts:
                 self.logger.debug(f"Already generating audio for text: {text[:50]}...")
                 return
-            self._generating_texts.add(text)
+            self._generating_texts.add(text_key)
 
-        def bg_worker():
-            try:
-                if self._cancelled:
-                    return
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                filename = loop.run_until_complete(self._generate_audio_file(text, symbol))
-                loop.close()
-
-                if filename and not self._cancelled:
-                    self._playback_queue.put(filename)
-            except Exception as e:
-                self.logger.error(f"Background TTS generation error: {e}")
-            finally:
-                # Safely discard to avoid KeyError if already removed
-                with self._generating_lock:
-                    self._generating_texts.discard(text)
+        asyncio.run_coroutine_threadsafe(
+            self._generate_in_background(text, text_key, symbol), self.loop
+        )
 
-        threading.Thread(target=bg_worker, daemon=True).start()
+    @staticmethod
+    def _text_key(text):
+        """Fixed-size digest used to deduplicate in-progress TTS requests."""
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    async def _generate_in_background(self, text, text_key, symbol=None):
+        """Generate TTS for generate_and_play_background and enqueue it for playback."""
+        try:
+            if self._cancelled:
+                return
+            filename = await self._generate_audio_file(text, symbol)
+            if filename and not self._cancelled:
+                self._enqueue_playback(filename)
+        except Exception as e:
+            self.logger.error(f"Background TTS generation error: {e}")
+        finally:
+            # Safely discard to avoid KeyError if already removed
+            with self._generating_lock:
+                self._generating_texts.discard(text_key)
 
     async def generate_and_play(self, text, symbol=None):
         """
@@ -194,127 +261,202 @@ class VoiceHandler(AvatarObserver):
         if self._cancelled or not self.voice_id:
             return ""
 
-        filename = await self._generate_audio_file(text, symbol)
+        filename = await self._run_on_voice_loop(self._generate_audio_file(text, symbol))
         if filename and not self._cancelled:
-            self._playback_queue.put(filename)
+            self._enqueue_playback(filename)
         return filename
 
+    def _enqueue_playback(self, filename):
+        """Hand a generated file to the playback task from any thread."""
+        self.loop.call_soon_threadsafe(self._playback_queue.put_nowait, filename)
+
+    async def _run_on_voice_loop(self, coro):
+        """Await `coro` on the voice loop so the async TTS client stays bound to one loop."""
+        if not self.loop.is_running() or asyncio.get_running_loop() is self.loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    async def _stream_speech_to_file(self, text, file):
+        """
+        Stream ElevenLabs TTS audio for `text` into `file` (a path or an open descriptor).
+        Returns (chunk_count, total_bytes, tts_duration), or None if cancelled mid-stream.
+        """
+        tts_start = time.monotonic()
+        tts_duration = 0.0
+        chunk_count = 0
+        total_bytes = 0
+        audio = self.elevenlabs_client.text_to_speech.convert(
+            voice_id=self.voice_id,
+            model_id=self.voice_model,
+            text=text,
+            output_format="mp3_44100_128"
+        )
+        async with aiofiles.open(file, 'wb') as f:
+            async for chunk in audio:
+                if self._cancelled:
+                    return None
+                if isinstance(chunk, bytes):
+                    if not chunk_count:
+                        # Time to first audio byte is the actual TTS latency
+                        tts_duration = time.monotonic() - tts_start
+                    chunk_count += 1
+                    total_bytes += len(chunk)
+                    await f.write(chunk)
+        return chunk_count, total_bytes, tts_duration
+
+    def _tts_cache_path(self, text):
+        """Cache file for `text` spoken with the current voice and model."""
+        key = hashlib.blake2b(
+            f"{self.voice_id}|{self.voice_model}|{text}".encode(), digest_size=16
+        ).hexdigest()
+        return os.path.join(self._tts_cache_dir, f"{key}.mp3")
+
+    def _evict_tts_cache(self):
+        """Remove least recently used cache files until the cache fits its size budget."""
+        try:
+            with os.scandir(self._tts_cache_dir) as it:
+                entries = []
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith('.mp3'):
+                        st = entry.stat()
+                        entries.append((st.st_atime, st.st_size, entry.path))
+
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self._tts_cache_max_bytes:
+                    break
+                os.remove(path)
+                total_bytes -= size
+                self.logger.debug(f"Evicted cached audio file: {path}")
+        except OSError as e:
+            self.logger.error(f"Error evicting TTS cache: {e}")
+
     async def _generate_audio_file(self, text, symbol=None) -> str:
         """
-        Creates an MP3 from TTS; does not block playback. If cancelled, returns "".
+        Creates an MP3 from TTS (or reuses a cached one); does not block playback.
+        If cancelled, returns "".
         """
         if self._cancelled or not self.voice_id:
             return ""
 
-        start_time = time.time()
-        self.perf_logger.info(f"VOICE_GEN_START|symbol={symbol}|text_length={len(text)}")
+        start_time = time.monotonic()
+        self.perf_logger.info("VOICE_GEN_START|symbol=%s|text_length=%d", symbol, len(text))
 
         try:
             self.logger.info("Generating voice in background...")
 
-            # Do TTS
-            tts_start = time.time()
-            audio = self.elevenlabs_client.text_to_speech.convert(
-                voice_id=self.voice_id,
-                model_id=self.voice_model,
-                text=text
-            )
-            tts_duration = time.time() - tts_start
-            self.perf_logger.debug(f"VOICE_TTS_CONVERT|duration={tts_duration:.3f}s")
+            if self._tts_cache_dir is None:
+                # Disk cache unavailable: synthesize into the private temp dir
+                filename = await self.text_to_speech(text) or ""
+                self.perf_logger.info(
+                    "VOICE_GEN_END|symbol=%s|cache=disabled|total_duration=%.3fs",
+                    symbol, time.monotonic() - start_time
+                )
+                return filename
+
+            filename = self._tts_cache_path(text)
+            if os.path.isfile(filename) and os.path.getsize(filename) > 0:
+                # Refresh access time explicitly; many filesystems mount with noatime
+                os.utime(filename)
+                self.perf_logger.info(
+                    "VOICE_GEN_END|symbol=%s|cache=hit|total_duration=%.3fs",
+                    symbol, time.monotonic() - start_time
+                )
+                return filename
 
-            if self._cancelled:
-                return ""
+            # Stream TTS to a temp file, then move it into the cache atomically
+            fd, tmp_filename = tempfile.mkstemp(suffix='.tmp', dir=self._tts_cache_dir)
+            save_start = time.monotonic()
+            try:
+                result = await self._stream_speech_to_file(text, fd)
+                if result is None or self._cancelled:
+                    return ""
+                os.replace(tmp_filename, filename)
+            finally:
+                if os.path.exists(tmp_filename):
+                    os.remove(tmp_filename)
+            chunk_count, total_bytes, tts_duration = result
+            self.perf_logger.debug("VOICE_TTS_CONVERT|duration=%.3fs", tts_duration)
+            await asyncio.get_running_loop().run_in_executor(self._blocking_executor, self._evict_tts_cache)
 
-            # Unique filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-            unique_id = str(uuid.uuid4())[:8]
-            if symbol:
-                filename = f"analysis_{symbol}_{timestamp}_{unique_id}.mp3"
-            else:
-                filename = f"analysis_{timestamp}_{unique_id}.mp3"
-
-            # Save to disk
-            save_start = time.time()
-            chunk_count = 0
-            total_bytes = 0
-            with open(filename, 'wb') as f:
-                for chunk in audio:
-                    if self._cancelled:
-                        return ""
-                    if isinstance(chunk, bytes):
-                        chunk_count += 1
-                        total_bytes += len(chunk)
-                        f.write(chunk)
-
-            save_duration = time.time() - save_start
+            save_duration = time.monotonic() - save_start
             self.perf_logger.debug(
-                f"VOICE_FILE_SAVE|chunks={chunk_count}|bytes={total_bytes}|duration={save_duration:.3f}s"
+                "VOICE_FILE_SAVE|chunks=%d|bytes=%d|duration=%.3fs",
+                chunk_count, total_bytes, save_duration
             )
             self.logger.info(f"Saved audio (background) to: {filename}")
 
-            total_duration = time.time() - start_time
+            total_duration = time.monotonic() - start_time
             self.perf_logger.info(
-                f"VOICE_GEN_END|symbol={symbol}|total_duration={total_duration:.3f}s|"
-                f"tts_duration={tts_duration:.3f}s|save_duration={save_duration:.3f}s"
+                "VOICE_GEN_END|symbol=%s|total_duration=%.3fs|tts_duration=%.3fs|save_duration=%.3fs",
+                symbol, total_duration, tts_duration, save_duration
             )
             return filename
 
         except Exception as e:
-            total_duration = time.time() - start_time
+            total_duration = time.monotonic() - start_time
             self.logger.error(f"Background voice generation failed: {e}")
             self.perf_logger.error(
                 f"VOICE_GEN_ERROR|symbol={symbol}|error={e}|duration={total_duration:.3f}s"
             )
             return ""
 
-    def _playback_worker(self):
+    async def _playback_worker(self):
         """
         Continuously takes filenames from the queue, playing them one at a time.
         """
-        while not self._stop_playback_thread:
+        while not self._stop_playback:
+            filename = await self._playback_queue.get()
             try:
-                filename = self._playback_queue.get(True)
                 if not filename or self._cancelled:
                     continue
-                self._play_audio_blocking(filename)
-                self._playback_queue.task_done()
+                await self._play_audio(filename)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 self.logger.error(f"Playback worker error: {e}")
-                time.sleep(0.2)
+                await asyncio.sleep(0.2)
+            finally:
+                self._playback_queue.task_done()
 
-    def _play_audio_blocking(self, filename: str):
+    async def _play_audio(self, filename: str):
         """
-        Actually do blocking playback using AVFoundation or fallback (afplay/playsound).
+        Play a file using AVFoundation or fallback (afplay/playsound) without blocking the loop.
         If `_cancelled` goes True during playback, we break out early.
         """
         if self._cancelled:
             return
 
-        start_time = time.time()
-        self.perf_logger.info(f"AUDIO_PLAY_START|file={filename}")
+        start_time = time.monotonic()
+        self.perf_logger.info("AUDIO_PLAY_START|file=%s", filename)
         try:
             success = False
             if self.use_avfoundation:
-                success = self.play_audio_macos(filename)
+                success = await self.play_audio_macos(filename)
 
             if not success and not self._cancelled:
-                success = self.play_audio_fallback(filename)
+                success = await self.play_audio_fallback(filename)
 
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             if success and not self._cancelled:
-                self.perf_logger.info(f"AUDIO_PLAY_END|file={filename}|duration={duration:.3f}s")
+                self.perf_logger.info("AUDIO_PLAY_END|file=%s|duration=%.3fs", filename, duration)
             else:
                 raise Exception("Audio playback failed")
         except Exception as e:
             self.logger.error(f"Error playing audio file {filename}: {e}")
             self.perf_logger.error(
-                f"AUDIO_PLAY_ERROR|file={filename}|error={e}|duration={time.time() - start_time:.3f}s"
+                f"AUDIO_PLAY_ERROR|file={filename}|error={e}|duration={time.monotonic() - start_time:.3f}s"
             )
 
-    def play_audio_macos(self, filename):
-        """Blocking playback with AVFoundation on macOS."""
+    def _finish_playback(self):
+        """Resolve the pending AVFoundation playback future; runs on the voice loop."""
+        if self._playback_done and not self._playback_done.done():
+            self._playback_done.set_result(None)
+
+    async def play_audio_macos(self, filename):
+        """Playback with AVFoundation on macOS, awaiting the delegate's completion callback."""
         try:
-            if self._cancelled:
+            if self._cancelled or _PlaybackDelegate is None:
                 return False
 
             url = self.AVFoundation.NSURL.fileURLWithPath_(filename)
@@ -322,38 +464,50 @@ class VoiceHandler(AvatarObserver):
             if not player:
                 return False
 
+            # The delegate property is weak, so keep our own reference to it
+            delegate = _PlaybackDelegate.alloc().init()
+            delegate.on_finish = lambda: self.loop.call_soon_threadsafe(self._finish_playback)
+            self._player_delegate = delegate
+            self._playback_done = self.loop.create_future()
+
+            player.setDelegate_(delegate)
             self._current_player = player
             player.prepareToPlay()
             player.setRate_(1.1)
             player.play()
 
-            while player.isPlaying() and not self._cancelled:
-                time.sleep(0.1)
+            # Timeout guards against a completion callback that never arrives
+            try:
+                await asyncio.wait_for(self._playback_done, timeout=player.duration() + 1.0)
+            except asyncio.TimeoutError:
+                player.stop()
 
             self._current_player = None
+            self._player_delegate = None
+            self._playback_done = None
             return not self._cancelled
         except Exception as e:
             self.logger.error(f"AVFoundation playback error: {e}")
             return False
 
-    def play_audio_fallback(self, filename):
-        """Blocking fallback method (afplay on macOS or playsound elsewhere)."""
+    async def play_audio_fallback(self, filename):
+        """Fallback method (afplay/ffplay/mpg123 subprocess, or playsound if none is installed)."""
         try:
             if self._cancelled:
                 return False
 
-            if platform.system() == "Darwin":
-                import subprocess
-                self._current_process = subprocess.Popen(
-                    ['afplay', '-r', '1.1', filename],
-                    preexec_fn=os.setsid  # separate process group
+            if self._fallback_player:
+                self._current_process = await asyncio.create_subprocess_exec(
+                    *self._fallback_player, filename,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    start_new_session=True  # separate process group
                 )
-                self._current_process.wait()
+                await self._current_process.wait()
                 self._current_process = None
                 return not self._cancelled
             else:
                 from playsound import playsound
-                playsound(filename)
+                await self.loop.run_in_executor(self._blocking_executor, playsound, filename)
                 return not self._cancelled
 
         except Exception as e:
@@ -368,52 +522,34 @@ class VoiceHandler(AvatarObserver):
         if self._cancelled or not self.voice_id:
             return None
 
-        start_time = time.time()
-        self.perf_logger.info(f"TTS_START|text_length={len(text)}")
+        start_time = time.monotonic()
+        self.perf_logger.info("TTS_START|text_length=%d", len(text))
 
         try:
-            tts_start = time.time()
-            audio = self.elevenlabs_client.text_to_speech.convert(
-                voice_id=self.voice_id,
-                model_id=self.voice_model,
-                text=text
-            )
-            tts_duration = time.time() - tts_start
-            self.perf_logger.debug(f"TTS_CONVERT|duration={tts_duration:.3f}s")
+            fd, filename = tempfile.mkstemp(prefix='speech_', suffix='.mp3', dir=self._tts_dir)
 
-            if self._cancelled:
+            save_start = time.monotonic()
+            result = await self._stream_speech_to_file(text, fd)
+            if result is None or self._cancelled:
                 return None
+            chunk_count, total_bytes, tts_duration = result
+            self.perf_logger.debug("TTS_CONVERT|duration=%.3fs", tts_duration)
 
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-            unique_id = str(uuid.uuid4())[:8]
-            filename = f"speech_{timestamp}_{unique_id}.mp3"
-
-            save_start = time.time()
-            chunk_count = 0
-            total_bytes = 0
-            with open(filename, 'wb') as f:
-                for chunk in audio:
-                    if self._cancelled:
-                        return None
-                    if isinstance(chunk, bytes):
-                        chunk_count += 1
-                        total_bytes += len(chunk)
-                        f.write(chunk)
-
-            save_duration = time.time() - save_start
+            save_duration = time.monotonic() - save_start
             self.perf_logger.debug(
-                f"TTS_FILE_SAVE|chunks={chunk_count}|bytes={total_bytes}|duration={save_duration:.3f}s"
+                "TTS_FILE_SAVE|chunks=%d|bytes=%d|duration=%.3fs",
+                chunk_count, total_bytes, save_duration
             )
 
-            total_duration = time.time() - start_time
+            total_duration = time.monotonic() - start_time
             self.perf_logger.info(
-                f"TTS_END|total_duration={total_duration:.3f}s|tts_duration={tts_duration:.3f}s|"
-                f"save_duration={save_duration:.3f}s"
+                "TTS_END|total_duration=%.3fs|tts_duration=%.3fs|save_duration=%.3fs",
+                total_duration, tts_duration, save_duration
             )
             return filename
 
         except Exception as e:
-            total_duration = time.time() - start_time
+            total_duration = time.monotonic() - start_time
             self.logger.error(f"Text to speech conversion failed: {e}")
             self.perf_logger.error(
                 f"TTS_ERROR|error={e}|duration={total_duration:.3f}s"
@@ -426,9 +562,11 @@ class VoiceHandler(AvatarObserver):
             self.logger.info("Cleaning up voice handler...")
 
             self.stop_current_playback()
-            self._stop_playback_thread = True
-            self._playback_queue.put("")  # sentinel to unblock
-            self._playback_thread.join(timeout=2)
+            self._stop_playback = True
+            self._playback_task.cancel()
+            self._blocking_executor.shutdown(wait=False, cancel_futures=True)
+            if self._owns_loop:
+                self.loop.call_soon_threadsafe(self.loop.stop)
 
             if self.use_avfoundation:
                 try:
@@ -441,17 +579,23 @@ class VoiceHandler(AvatarObserver):
             if hasattr(self, 'elevenlabs_client'):
                 self.elevenlabs_client = None
 
-            # Remove temp MP3 files
+            # Remove temp MP3 files (runs on the UI's background cleanup thread)
+            shutil.rmtree(self._tts_dir, ignore_errors=True)
             try:
-                dir_path = os.getcwd()
-                for fname in os.listdir(dir_path):
-                    if fname.startswith(('analysis_', 'speech_')) and fname.endswith('.mp3'):
-                        file_path = os.path.join(dir_path, fname)
-                        try:
-                            os.remove(file_path)
-                            self.logger.debug(f"Removed temp audio file: {fname}")
-                        except Exception as ex:
-                            self.logger.error(f"Error removing audio file {fname}: {ex}")
+                # Sweep stray files that older builds wrote into the working directory
+                with os.scandir(os.getcwd()) as it:
+                    victims = [
+                        entry.path for entry in it
+                        if entry.name.startswith(('analysis_', 'speech_'))
+                        and entry.name.endswith('.mp3') and entry.is_file()
+                    ]
+                for file_path in victims:
+                    try:
+                        os.unlink(file_path)
+                    except OSError as ex:
+                        self.logger.error(f"Error removing audio file {file_path}: {ex}")
+                if victims:
+                    self.logger.debug(f"Removed {len(victims)} stray temp audio files")
             except Exception as ex:
                 self.logger.error(f"Error cleaning up temp audio files: {ex}")
 
@@ -3,19 +3,153 @@
 import asyncio
 import logging
 from typing import Optional, Dict, Any
-import sounddevice as sd
 import numpy as np
 import base64
-import wave
+import struct
 import io
+import re
 
-from PySide6.QtWidgets import QPushButton, QWidget
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, Property, QObject
+from PySide6.QtWidgets import QPushButton, QWidget, QGraphicsOpacityEffect
+from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QObject
 from PySide6.QtGui import QColor
 
 # NEW/UPDATED CODE
 import json
-from openai import AsyncOpenAI
+import httpx
+import orjson
+import websockets
+
+# Realtime transcription endpoint; audio is streamed to it while the user is still speaking
+REALTIME_TRANSCRIPTION_URL = "wss://api.openai.com/v1/realtime?intent=transcription"
+# How long to wait for the streamed transcript before falling back to a batch upload
+STREAM_TRANSCRIPTION_TIMEOUT = 10.0
+# Level normalization limits: recordings peaking below the noise floor (~-36 dBFS)
+# are left alone, and louder ones are boosted at most this much, so near-silence
+# or noise isn't amplified into something Whisper hallucinates words from
+NORMALIZE_NOISE_FLOOR = 512
+NORMALIZE_MAX_GAIN = 10.0
+# A partial transcript is only classified speculatively once it has settled:
+# it ends a sentence and has at least this many words (early deltas are fragments)
+SPECULATION_MIN_WORDS = 3
+
+# Tools schema (formerly functions) offered to the intent classifier
+VOICE_COMMAND_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "takeScreenshot",
+            "description": "Takes a screenshot when the user wants to analyze or get opinions about what's currently visible on screen. Use this when the user refers to something they're looking at or wants your analysis of visual content. Examples: 'What do you think about this?', 'Is this a good investment?', 'Can you explain what I'm looking at?', 'Analyze this chart', 'What do you see here?', 'Does this look right to you?'",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "full_or_region": {
+                        "type": "string",
+                        "enum": ["full", "region"]
+                    }
+                },
+                "required": ["full_or_region"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "runCommand",
+            "description": "Executes an action or command when the user wants the system to do something. Use this for any requests to perform actions, navigate, or create/modify content. Examples: 'Go to Amazon', 'Open my email', 'Create a new document', 'Search for flights to Paris', 'Install Visual Studio Code', 'Toggle dark mode', 'Increase the volume'",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "command_text": {
+                        "type": "string",
+                        "description": "The user-intended command text"
+                    }
+                },
+                "required": ["command_text"]
+            }
+        }
+    }
+]
+
+# Unambiguous phrasings that are classified locally, skipping the GPT round trip.
+# Commands only match as a lone keyword: "create a summary of this chart" or
+# "close look at this token" are not commands, so longer utterances go to GPT.
+FAST_COMMAND_RE = re.compile(
+    r'^\s*(open|go to|search for|create|install|launch|toggle|increase|decrease|play|pause|close)\s*[.!?]?\s*$',
+    re.IGNORECASE
+)
+FAST_SCREENSHOT_RE = re.compile(
+    r'\b(what do you (think|see)|what(\'s| is) (this|that)|(analy[sz]e|look at) (this|that)|on (my |the )?screen)\b',
+    re.IGNORECASE
+)
+
+# System message for the intent classifier; only the user message is built per call
+CLASSIFIER_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a helpful AI that determines whether the user wants to:"
+        "1) Analyze something currently visible on their screen (using takeScreenshot), or"
+        "2) Perform an action or execute a command (using runCommand)"
+        "\n\n"
+        "Use takeScreenshot when the user:"
+        "- Asks for your opinion or analysis of something they're looking at"
+        "- Uses demonstrative pronouns like 'this' or 'that' referring to visible content"
+        "- Wants you to explain or evaluate something on screen"
+        "- Asks about the quality, correctness, or meaning of visible content"
+        "\n\n"
+        "Use runCommand when the user:"
+        "- Wants to navigate somewhere or open something"
+        "- Requests any kind of action or system change"
+        "- Asks you to create, modify, or interact with content"
+        "- Gives instructions for tasks to perform"
+        "\n\n"
+        "If you're unsure, consider whether the user is asking about something they're looking at (takeScreenshot) or asking you to do something (runCommand)."
+        "You must always choose one of these two functions."
+    ),
+}
+
+class WavBufferReader(io.RawIOBase):
+    """
+    Read-only file over a WAV header plus a PCM buffer, so the recording can be
+    uploaded straight from the numpy array without copying it into a BytesIO.
+    """
+
+    def __init__(self, header: bytes, pcm: np.ndarray):
+        super().__init__()
+        self._parts = [memoryview(header), memoryview(pcm).cast('B')]
+        self._size = sum(part.nbytes for part in self._parts)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: self._size}[whence]
+        self._pos = min(max(base + offset, 0), self._size)
+        return self._pos
+
+    def readinto(self, b) -> int:
+        out = memoryview(b).cast('B')
+        written = 0
+        offset = self._pos
+        for part in self._parts:
+            if offset >= part.nbytes:
+                offset -= part.nbytes
+                continue
+            n = min(part.nbytes - offset, len(out) - written)
+            out[written:written + n] = part[offset:offset + n]
+            written += n
+            offset = 0
+            if written == len(out):
+                break
+        self._pos += written
+        return written
+
 
 class VoiceCommandButton(QPushButton):
     """Voice command button with recording state"""
@@ -31,11 +165,13 @@ class VoiceCommandButton(QPushButton):
         self.setCursor(Qt.PointingHandCursor)
         self.is_recording = False
         
-        # Initialize the property
-        self._recording_opacity = 1.0
+        # Pulse via an opacity effect so the animation never touches the stylesheet
+        self._opacity_effect = QGraphicsOpacityEffect(self)
+        self._opacity_effect.setOpacity(1.0)
+        self.setGraphicsEffect(self._opacity_effect)
         
         # Create property animation for pulsing effect
-        self.pulse_animation = QPropertyAnimation(self, b"recording_opacity")
+        self.pulse_animation = QPropertyAnimation(self._opacity_effect, b"opacity")
         self.pulse_animation.setDuration(1000)
         self.pulse_animation.setStartValue(1.0)
         self.pulse_animation.setEndValue(0.5)
@@ -45,26 +181,13 @@ class VoiceCommandButton(QPushButton):
         self.logger = logging.getLogger('VoiceCommandButton')
         self.setToolTip("Click to start recording")
 
-    def get_recording_opacity(self):
-        return self._recording_opacity
-
-    def set_recording_opacity(self, value):
-        self._recording_opacity = value
-        self._setup_styling()
-
-    recording_opacity = Property(float, get_recording_opacity, set_recording_opacity)
-
     def _setup_styling(self) -> None:
         """Set up button styling based on state"""
         if self.is_recording:
-            # Recording state with opacity animation
-            opacity = int(self._recording_opacity * 255)  # Convert to 0-255 range
-            color = QColor(self.accent_color)
-            bg_color = f"rgba({color.red()}, {color.green()}, {color.blue()}, {opacity})"
-            
+            # Recording state; the opacity effect pulses the whole button
             self.setStyleSheet(f"""
                 QPushButton {{
-                    background-color: {bg_color};
+                    background-color: {QColor(self.accent_color).name()};
                     border-radius: 8px;
                     color: #000000;
                     font-size: 18px;
@@ -95,6 +218,7 @@ class VoiceCommandButton(QPushButton):
                 }}
             """)
             self.pulse_animation.stop()
+            self._opacity_effect.setOpacity(1.0)
             self.setToolTip("Click to start recording")
 
     def toggle_recording(self) -> None:
@@ -108,7 +232,6 @@ class VoiceCommandButton(QPushButton):
             self.logger.error(f"Toggle recording error: {str(e)}")
             self.is_recording = False
             self.pulse_animation.stop()
-            self._recording_opacity = 1.0
             self._setup_styling()
 
 
@@ -143,55 +266,77 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
         if not self.api_key:
             raise ValueError("OpenAI API key required for voice commands")
             
-        # Initialize state
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # Initialize state; one HTTP/2 pool with long keep-alive so Whisper and
+        # GPT requests share a warm connection instead of re-handshaking after idle
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=120)
+        )
+        from openai import AsyncOpenAI  # deferred: pydantic model setup is slow at import
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=self._http)
         self.stream = None
-        self.recorded_chunks = []  # Store chunks of audio data
         self.voice_button = None
+
+        # 'api' streams to OpenAI; 'local' runs faster-whisper on this machine
+        voice_cfg = config.get('voice_commands', {})
+        self.transcription_backend = voice_cfg.get('transcription_backend', 'api')
+        self._local_model_name = voice_cfg.get('local_model', 'base.en')
+        self._local_model = None  # Loaded on first use, off the voice loop
         
-        # Audio settings - match Whisper requirements
-        self.sample_rate = 16000  # Whisper expects 16kHz
+        # Audio settings - the realtime API's pcm16 format is 24kHz, faster-whisper wants 16kHz
+        self.sample_rate = 16000 if self.transcription_backend == 'local' else 24000
         self.channels = 1        # Mono audio
         self.dtype = np.int16    # 16-bit audio
+        # Samples per callback: 4096 at 24kHz is ~6 callbacks/s instead of ~23 with 1024,
+        # at the cost of up to ~170ms extra delay before stop sees the last block
+        self.blocksize = voice_cfg.get('blocksize', 4096)
+
+        # Optional Silero VAD: skips silent recordings and trims silence before batch upload.
+        # Loaded in a worker thread on first use (it pulls in torch); until then
+        # recordings are sent untrimmed
+        self._vad = None
+        self._vad_enabled = voice_cfg.get('vad', True)
+        self._vad_load_task = None
+
+        # Preallocated recording buffer (30s to start, doubled when exceeded)
+        self._buf = np.empty(self.sample_rate * 30, dtype=self.dtype)
+        self._write_idx = 0
+
+        # Streaming transcription state for the current recording
+        self._loop = None
+        self._audio_queue = None
+        self._stream_task = None
+        # (transcript, task) for a classification started on a partial transcript
+        self._speculative_classification = None
 
-        # Define tools schema (formerly functions)
-        self.tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "takeScreenshot",
-                    "description": "Takes a screenshot when the user wants to analyze or get opinions about what's currently visible on screen. Use this when the user refers to something they're looking at or wants your analysis of visual content. Examples: 'What do you think about this?', 'Is this a good investment?', 'Can you explain what I'm looking at?', 'Analyze this chart', 'What do you see here?', 'Does this look right to you?'",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "full_or_region": {
-                                "type": "string",
-                                "enum": ["full", "region"]
-                            }
-                        },
-                        "required": ["full_or_region"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "runCommand",
-                    "description": "Executes an action or command when the user wants the system to do something. Use this for any requests to perform actions, navigate, or create/modify content. Examples: 'Go to Amazon', 'Open my email', 'Create a new document', 'Search for flights to Paris', 'Install Visual Studio Code', 'Toggle dark mode', 'Increase the volume'",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "command_text": {
-                                "type": "string",
-                                "description": "The user-intended command text"
-                            }
-                        },
-                        "required": ["command_text"]
-                    }
-                }
-            }
-        ]
         
+    def _start_vad_load(self) -> None:
+        """Begin loading the VAD model off the calling loop, once"""
+        if not self._vad_enabled or self._vad_load_task is not None:
+            return
+        self._vad_load_task = asyncio.ensure_future(asyncio.to_thread(self._load_vad))
+
+    def _load_vad(self) -> None:
+        """Load Silero VAD (blocking; run in a worker thread)"""
+        try:
+            from silero_vad import load_silero_vad
+            self._vad = load_silero_vad(onnx=True)
+            self.logger.debug("VAD model loaded")
+        except ImportError:
+            self.logger.debug("silero-vad not installed; recordings are sent untrimmed")
+        except Exception as e:
+            self.logger.warning(f"Could not load VAD model: {str(e)}")
+
+    async def warmup(self) -> None:
+        """Open the pooled OpenAI connection before the first utterance needs it"""
+        self._start_vad_load()
+        try:
+            await self.client.models.list()
+            self.logger.debug("OpenAI connection warmed up")
+        except Exception as e:
+            self.logger.debug(f"OpenAI warmup failed: {str(e)}")
+
     def set_voice_button(self, button):
         """Set reference to UI button"""
         self.voice_button = button
@@ -199,15 +344,23 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
     async def start_recording(self) -> None:
         """Start audio recording"""
         try:
-            self.recorded_chunks = []  # Reset chunks
+            self._write_idx = 0  # Reset buffer
+            self._start_vad_load()  # No-op once started (normally by warmup)
+
+            # Start streaming audio to the realtime transcription API as it is recorded
+            self._loop = asyncio.get_running_loop()
+            if self.transcription_backend != 'local':
+                self._audio_queue = asyncio.Queue()
+                self._stream_task = asyncio.create_task(self._stream_transcription(self._audio_queue))
             
-            # Initialize and start audio stream
+            # Initialize and start audio stream (PortAudio is only loaded once voice is used)
+            import sounddevice as sd
             self.stream = sd.InputStream(
                 channels=self.channels,
                 samplerate=self.sample_rate,
                 dtype=self.dtype,
                 callback=self._audio_callback,
-                blocksize=1024,
+                blocksize=self.blocksize,
                 latency='low'
             )
             self.stream.start()
@@ -215,13 +368,181 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
             
         except Exception as e:
             self.logger.error(f"Recording start error: {str(e)}")
+            self._abort_stream_transcription()
             raise
             
     def _audio_callback(self, indata, frames, time, status) -> None:
         """Handle incoming audio data"""
         if status:
             self.logger.warning(f"Audio callback status: {status}")
-        self.recorded_chunks.append(indata.copy())
+        # First channel only; the strided view is gathered by the buffer write below
+        chunk = indata[:, 0] if indata.ndim == 2 else indata
+        start = self._write_idx
+        needed = start + frames
+        if needed > len(self._buf):
+            self._buf = np.resize(self._buf, max(len(self._buf) * 2, needed))
+        # Slice assignment copies straight into the buffer, no intermediate array
+        self._buf[start:needed] = chunk
+        self._write_idx = needed
+
+        queue = self._audio_queue
+        if queue is not None:
+            # Read back from the contiguous buffer rather than the strided device block
+            self._loop.call_soon_threadsafe(queue.put_nowait, self._buf[start:needed].tobytes())
+
+    async def _stream_transcription(self, queue: asyncio.Queue) -> Optional[str]:
+        """
+        Send queued PCM16 chunks to the realtime transcription API until a None
+        sentinel arrives, then commit the buffer and return the final transcript.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "OpenAI-Beta": "realtime=v1"
+        }
+        async with websockets.connect(REALTIME_TRANSCRIPTION_URL, additional_headers=headers) as ws:
+            await ws.send(json.dumps({
+                "type": "transcription_session.update",
+                "session": {
+                    "input_audio_format": "pcm16",
+                    "input_audio_transcription": {"model": "whisper-1"},
+                    "turn_detection": None
+                }
+            }))
+
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                await ws.send(json.dumps({
+                    "type": "input_audio_buffer.append",
+                    "audio": base64.b64encode(chunk).decode('ascii')
+                }))
+
+            await ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
+            partial = ""
+            async for message in ws:
+                event = orjson.loads(message)
+                event_type = event.get("type")
+                if event_type == "conversation.item.input_audio_transcription.delta":
+                    partial += event.get("delta", "")
+                    self._speculate_classification(partial)
+                elif event_type == "conversation.item.input_audio_transcription.completed":
+                    return event.get("transcript", "")
+                if event_type == "error":
+                    raise RuntimeError(event.get("error", {}).get("message", "realtime API error"))
+        return None
+
+    @staticmethod
+    def _normalize_transcript(text: str) -> str:
+        """Case, punctuation and spacing folded away, for comparing transcripts"""
+        return " ".join(re.sub(r'[^\w\s]', ' ', text.lower()).split())
+
+    def _speculate_classification(self, partial: str) -> None:
+        """Start classifying a settled partial transcript while the final one is still pending"""
+        if self._speculative_classification is not None:
+            return
+        text = partial.strip()
+        if not text.endswith(('.', '!', '?')) or len(text.split()) < SPECULATION_MIN_WORDS:
+            return
+        task = asyncio.create_task(self._classify_intent_with_gpt(text))
+        self._speculative_classification = (self._normalize_transcript(text), task)
+
+    async def _classify_transcript(self, transcript: str) -> Dict[str, Any]:
+        """Classify the final transcript, reusing the speculative result unless the words changed"""
+        speculative = self._speculative_classification
+        self._speculative_classification = None
+        if speculative:
+            text, task = speculative
+            if text == self._normalize_transcript(transcript):
+                self.logger.debug("Using speculative classification")
+                return await task
+            task.cancel()
+        return await self._classify_intent_with_gpt(transcript)
+
+    def _cancel_speculative_classification(self) -> None:
+        """Drop a speculative classification that will not be used"""
+        if self._speculative_classification:
+            self._speculative_classification[1].cancel()
+            self._speculative_classification = None
+
+    def _abort_stream_transcription(self) -> None:
+        """Drop the realtime transcription stream without waiting for a transcript"""
+        if self._stream_task:
+            self._stream_task.cancel()
+            self._stream_task = None
+        self._audio_queue = None
+
+    async def _finish_stream_transcription(self) -> Optional[str]:
+        """Close the audio stream to the realtime API and wait for its transcript (None on failure)"""
+        queue, task = self._audio_queue, self._stream_task
+        self._audio_queue = None
+        self._stream_task = None
+        if task is None:
+            return None
+
+        # Queue the sentinel behind any chunks the audio callback already scheduled
+        self._loop.call_soon(queue.put_nowait, None)
+        try:
+            return await asyncio.wait_for(task, STREAM_TRANSCRIPTION_TIMEOUT)
+        except Exception as e:
+            self.logger.warning(f"Streaming transcription failed, falling back to upload: {str(e)}")
+            return None
+
+    def _speech_bounds(self, audio_data: np.ndarray) -> Optional[tuple]:
+        """
+        Return (start, end) sample indices spanning the detected speech, or None if
+        the recording is silent. Without a VAD model (disabled, missing, or still
+        loading) the whole recording is kept.
+        """
+        if self._vad is None:
+            return 0, len(audio_data)
+
+        import torch
+        from silero_vad import get_speech_timestamps
+
+        # Silero runs at 8/16kHz; decimating to 8kHz is plenty for speech detection
+        step = self.sample_rate // 8000
+        audio_8k = torch.from_numpy(audio_data[::step].astype(np.float32) / 32768.0)
+        timestamps = get_speech_timestamps(audio_8k, self._vad, sampling_rate=8000)
+        if not timestamps:
+            return None
+        return timestamps[0]['start'] * step, timestamps[-1]['end'] * step
+
+    @staticmethod
+    def _normalize_levels(audio_data: np.ndarray, target_peak: int = 32000) -> None:
+        """Peak-normalize int16 samples in place using whole-array numpy ops (gain is capped)"""
+        if not len(audio_data):
+            return
+        # max/min instead of np.abs: abs(-32768) overflows int16 and needs a temp array
+        peak = max(int(audio_data.max()), -int(audio_data.min()))
+        if peak < NORMALIZE_NOISE_FLOOR:
+            return
+        gain = min(target_peak / peak, NORMALIZE_MAX_GAIN)
+        if gain <= 1.0:
+            return
+        np.multiply(audio_data, gain, out=audio_data, casting='unsafe')
+
+    def _transcribe_local(self, audio_data: np.ndarray) -> str:
+        """Transcribe with a local faster-whisper model (blocking; run in a worker thread)"""
+        if self._local_model is None:
+            from faster_whisper import WhisperModel
+            self._local_model = WhisperModel(self._local_model_name, device="cpu", compute_type="int8")
+
+        audio_float32 = audio_data.astype(np.float32) / 32768.0
+        segments, _ = self._local_model.transcribe(audio_float32, beam_size=1, vad_filter=True)
+        # segments is lazy; joining it is what actually runs the model
+        return " ".join(segment.text.strip() for segment in segments)
+
+    async def _transcribe_batch(self, audio_data: np.ndarray) -> str:
+        """Upload the whole recording to Whisper as a WAV file"""
+        # Fixed 44-byte PCM header, then the samples read in place from the buffer
+        wav_file = io.BufferedReader(WavBufferReader(self._wav_header(audio_data.nbytes), audio_data))
+
+        response = await self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=("audio.wav", wav_file, "audio/wav")
+        )
+        return response.text if hasattr(response, 'text') else str(response)
             
     async def stop_recording(self) -> None:
         """Stop recording, transcribe, then classify with GPT function-calling."""
@@ -233,29 +554,38 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
                 self.stream = None
 
             # Check if we have recorded anything
-            if not self.recorded_chunks:
+            if not self._write_idx:
                 self.logger.warning("No audio recorded")
+                self._abort_stream_transcription()
+                return
+
+            # Recorded samples, viewed in place. The next recording gets a fresh
+            # buffer (np.empty doesn't touch memory) so it can't overwrite these
+            # samples while they are still being trimmed or uploaded.
+            audio_data = self._buf[:self._write_idx]
+            self._buf = np.empty(len(self._buf), dtype=self.dtype)
+            bounds = await asyncio.get_running_loop().run_in_executor(
+                None, self._speech_bounds, audio_data
+            )
+            if bounds is None:
+                self.logger.info("No speech detected in recording")
+                self._abort_stream_transcription()
                 return
 
-            # Combine chunks into single numpy array
-            audio_data = np.concatenate(self.recorded_chunks, axis=0)
-            
-            # Save as WAV file in memory
-            temp_buffer = io.BytesIO()
-            with wave.open(temp_buffer, 'wb') as wav:
-                wav.setnchannels(self.channels)
-                wav.setsampwidth(2)  # 16-bit
-                wav.setframerate(self.sample_rate)
-                wav.writeframes(audio_data.tobytes())
-            temp_buffer.seek(0)
-            
             # Transcribe using Whisper
             try:
-                response = await self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=("audio.wav", temp_buffer, "audio/wav")
-                )
-                transcript_text = response.text if hasattr(response, 'text') else str(response)
+                # Most of the audio is already uploaded; only the tail is left to send
+                transcript_text = await self._finish_stream_transcription()
+                if transcript_text is None:
+                    start, end = bounds
+                    # Quiet recordings transcribe better once levelled
+                    self._normalize_levels(audio_data[start:end])
+                    if self.transcription_backend == 'local':
+                        transcript_text = await asyncio.to_thread(
+                            self._transcribe_local, audio_data[start:end]
+                        )
+                    else:
+                        transcript_text = await self._transcribe_batch(audio_data[start:end])
                 
                 # Emit raw transcriptionComplete signal
                 if transcript_text and self.voice_button:
@@ -264,7 +594,7 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
                 
                 # Call GPT function router
                 if transcript_text.strip():
-                    classification = await self._classify_intent_with_gpt(transcript_text.strip())
+                    classification = await self._classify_transcript(transcript_text.strip())
                     if classification:
                         # Pass both classification and original transcript
                         self.classificationComplete.emit(classification, transcript_text.strip())
@@ -279,46 +609,44 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
             self.logger.error(f"Stop recording error: {str(e)}")
             raise
         finally:
-            self.recorded_chunks = []  # Clear chunks
+            self._cancel_speculative_classification()
+            self._write_idx = 0  # Clear buffer
+
+    def _wav_header(self, data_size: int) -> bytes:
+        """Build the RIFF/WAVE header for `data_size` bytes of 16-bit PCM audio"""
+        block_align = self.channels * 2  # 16-bit
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, self.channels, self.sample_rate,
+            self.sample_rate * block_align, block_align, 16,
+            b'data', data_size
+        )
 
     async def _classify_intent_with_gpt(self, user_input: str) -> Dict[str, Any]:
         """
         Sends the transcribed text to GPT with tools definitions
         so GPT can choose either 'takeScreenshot' or 'runCommand'.
+        Obvious phrasings are matched locally first without calling GPT.
         """
+        if FAST_COMMAND_RE.match(user_input):
+            self.logger.debug("Classified locally as runCommand")
+            return {"name": "runCommand", "arguments": {"command_text": user_input}}
+        if FAST_SCREENSHOT_RE.search(user_input):
+            self.logger.debug("Classified locally as takeScreenshot")
+            return {"name": "takeScreenshot", "arguments": {"full_or_region": "full"}}
+
         try:
             completion = await self.client.chat.completions.create(
                 model="gpt-4o",  # Fixed typo in model name from gpt-4o to gpt-4
                 messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a helpful AI that determines whether the user wants to:"
-                            "1) Analyze something currently visible on their screen (using takeScreenshot), or"
-                            "2) Perform an action or execute a command (using runCommand)"
-                            "\n\n"
-                            "Use takeScreenshot when the user:"
-                            "- Asks for your opinion or analysis of something they're looking at"
-                            "- Uses demonstrative pronouns like 'this' or 'that' referring to visible content"
-                            "- Wants you to explain or evaluate something on screen"
-                            "- Asks about the quality, correctness, or meaning of visible content"
-                            "\n\n"
-                            "Use runCommand when the user:"
-                            "- Wants to navigate somewhere or open something"
-                            "- Requests any kind of action or system change"
-                            "- Asks you to create, modify, or interact with content"
-                            "- Gives instructions for tasks to perform"
-                            "\n\n"
-                            "If you're unsure, consider whether the user is asking about something they're looking at (takeScreenshot) or asking you to do something (runCommand)."
-                            "You must always choose one of these two functions."
-                        ),
-                    },
+                    CLASSIFIER_SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": user_input
                     }
                 ],
-                tools=self.tools,
+                tools=VOICE_COMMAND_TOOLS,
                 tool_choice="auto"
             )
 
@@ -328,7 +656,7 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
                 tool_call = message.tool_calls[0]  # Get the first tool call
                 if tool_call.type == "function":
                     function_name = tool_call.function.name
-                    arguments = json.loads(tool_call.function.arguments)
+                    arguments = orjson.loads(tool_call.function.arguments)
                     
                     return {
                         "name": function_name,
@@ -350,7 +678,10 @@ class VoiceCommandHandler(QObject):  # Now inherits from QObject
                 self.stream.stop()
                 self.stream.close()
                 self.stream = None
-            self.recorded_chunks = []
+            self._cancel_speculative_classification()
+            self._abort_stream_transcription()
+            self._write_idx = 0
+            await self._http.aclose()
             self.logger.info("Voice command handler closed")
         except Exception as e:
             self.logger.error(f"Cleanup error: {str(e)}")
\ No newline at end of file
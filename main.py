@@ -5,13 +5,13 @@ from typing import Optional, Tuple
 import threading
 import signal
 import os
-import psutil
+import qasync
 from PySide6.QtWidgets import QApplication
 sys.dont_write_bytecode = True
 
 from config.config import load_config
 from config.logging_config import setup_logging
-from ui.app import AgentUI
+from ui.app import AgentUI, load_app_stylesheet
 from core.screenshot import ScreenshotHandler
 from core.skills.ticker_analysis.screenshot_analyzer import ScreenshotAnalyzer as ImageAnalyzer
 from core.computer_use_factory import get_computer_use_handler
@@ -30,6 +30,7 @@ class ApplicationManager:
         self.voice_loop = None
         self.voice_thread = None
         self.shutdown_initiated = False
+        self._shutdown_task = None  # _cleanup_and_exit task; cleanup must not cancel it
         self.logger.debug("ApplicationManager initialized")
 
     def setup_voice_event_loop(self):
@@ -140,12 +141,20 @@ class ApplicationManager:
         if self.loop and self.loop.is_running():
             try:
                 self.logger.info("Cleaning up pending tasks...")
-                pending = asyncio.all_tasks(self.loop)
+                # wait_for runs cleanup() in its own task, so the shutdown task
+                # awaiting it has to be spared explicitly as well
+                protected = {asyncio.current_task(), self._shutdown_task}
+                pending = [
+                    t for t in asyncio.all_tasks(self.loop)
+                    if not t.done() and t not in protected
+                ]
                 for task in pending:
-                    if not task.done():
-                        task.cancel()
+                    task.cancel()
                 if pending:
-                    await asyncio.gather(*pending, return_exceptions=True)
+                    # Bound shutdown time no matter how many tasks are outstanding
+                    _, not_cancelled = await asyncio.wait(pending, timeout=2.0)
+                    for task in not_cancelled:
+                        self.logger.warning(f"Task did not cancel during cleanup: {task}")
             except Exception as e:
                 self.logger.error(f"Error cleaning up tasks: {str(e)}")
 
@@ -159,6 +168,12 @@ class ApplicationManager:
         self.logger.info("UI requested shutdown, initiating cleanup...")
         
         try:
+            # Under qasync we are being called from inside the running loop, so
+            # cleanup can't be run to completion here; let the loop finish it
+            if self.loop and self.loop.is_running():
+                self._shutdown_task = self.loop.create_task(self._cleanup_and_exit())
+                return
+
             # Hide UI immediately
             if self.qt_app:
                 self.qt_app.quit()
@@ -176,6 +191,18 @@ class ApplicationManager:
             self.logger.error(f"Error during shutdown: {str(e)}")
             os._exit(1)
                 
+    async def _cleanup_and_exit(self):
+        """Run cleanup on the (qasync) main loop, then quit Qt and exit"""
+        try:
+            await asyncio.wait_for(self.cleanup(), timeout=5)
+        except Exception as e:
+            self.logger.error(f"Error during shutdown: {str(e)}")
+        finally:
+            if self.qt_app:
+                self.qt_app.quit()
+            self.logger.info("Shutdown complete, exiting...")
+            os._exit(0)
+
     def handle_shutdown(self, signum, frame):
         """Handle shutdown signals"""
         if self.shutdown_initiated:
@@ -190,10 +217,13 @@ class ApplicationManager:
             self.logger.debug("Starting application run sequence")
             # Initialize Qt Application first
             self.qt_app = QApplication(sys.argv)
+            # One app-wide stylesheet instead of per-widget parses at window init
+            self.qt_app.setStyleSheet(load_app_stylesheet())
             self.logger.debug("Qt Application initialized")
             
-            # Setup event loop
-            self.loop = asyncio.new_event_loop()
+            # Setup event loop; qasync drives asyncio from the Qt event loop so
+            # coroutines started from Qt slots run on the UI thread with no hand-off
+            self.loop = qasync.QEventLoop(self.qt_app)
             asyncio.set_event_loop(self.loop)
             self.logger.debug("Event loop initialized")
             
@@ -206,9 +236,10 @@ class ApplicationManager:
             self.logger.debug("Running async initialization...")
             self.loop.run_until_complete(self.async_init())
             
-            # Start Qt event loop
+            # Start Qt event loop (run_forever runs QApplication.exec under qasync)
             self.logger.info("Starting Qt event loop")
-            return self.qt_app.exec()
+            self.loop.run_forever()
+            return 0
             
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received...")
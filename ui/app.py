@@ -4,17 +4,13 @@ import sys
 import threading
 import asyncio
 import logging
-import time
 import platform
-import io
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from enum import Enum
 
 # Third-party library imports
-import cv2
 import numpy as np
-from PIL import Image
 
 # PySide6 imports
 from PySide6.QtWidgets import (
@@ -33,27 +29,18 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import (
     Qt, 
     QTimer, 
-    QSize, 
     QPoint, 
     Signal,
     Slot,       
     QRect, 
-    QPropertyAnimation, 
-    QBuffer, 
-    QEasingCurve,
-    QObject
+    QObject,
+    QThread
 )
 from PySide6.QtGui import (
     QColor, 
     QPainter, 
-    QBrush, 
     QPen, 
-    QLinearGradient, 
-    QFont, 
-    QPainterPath, 
-    QImage, 
-    QPixmap,
-    QTextCursor
+    QImage
 )
 
 # Local application imports
@@ -75,12 +62,35 @@ from core.computer_use_factory import get_computer_use_handler
 WINDOW_WIDTH = 300
 WINDOW_HEIGHT = 352
 INPUT_HEIGHT = 80
+# How long the window is hidden before a screenshot is taken
+SCREENSHOT_HIDE_DELAY_MS = 120
+
+# Oldest chat bubbles are dropped past this many, keeping the widget count bounded
+MAX_CHAT_BUBBLES = 100
+
+# Static widget styles, installed once on the QApplication by load_app_stylesheet()
+APP_STYLESHEET_PATH = Path(__file__).with_name("app.qss")
+
+# Button glyphs, shared instead of rebuilt on every lookup
+ICONS = {
+    'close': "✕",
+    'send': "➚"
+}
+
 
 # Rename the local UI-specific command states to avoid confusion with CMState
 class UICommandState(Enum):
     READY = 1
     RUNNING = 2
 
+def load_app_stylesheet():
+    """Read the app-wide stylesheet; call once and pass to QApplication.setStyleSheet"""
+    try:
+        return APP_STYLESHEET_PATH.read_text(encoding="utf-8")
+    except OSError as e:
+        logging.getLogger('CryptoAnalyzer.UI').error(f"Could not load {APP_STYLESHEET_PATH}: {str(e)}")
+        return ""
+
 def get_display_scaling():
     """Get display scaling factor safely"""
     try:
@@ -93,12 +103,13 @@ def get_display_scaling():
 
 class UICommandSignalBus(QObject):
     """A signal bus so we can emit UI updates on the main thread."""
-    commandUpdated = Signal(object)  # We'll pass the CommandContext
+    commandUpdatesPending = Signal()  # AgentUI._pending_ctx went from empty to non-empty
 
 class CommandInputWidget(QTextEdit):
     """Widget for command input"""
-    def __init__(self, parent=None):
+    def __init__(self, agent_ui=None, parent=None):
         super().__init__(parent)
+        self._agent_ui = agent_ui  # receives Enter presses
         # Define constant height
         self.FIXED_HEIGHT = 80
         
@@ -124,13 +135,8 @@ class CommandInputWidget(QTextEdit):
         if event.key() == Qt.Key_Return and not event.modifiers() & Qt.ShiftModifier:
             event.accept()  # Accept the event to prevent default handling
             
-            # Find the parent AgentUI instance and call _handle_command
-            parent = self.parent()
-            while parent is not None:
-                if isinstance(parent, AgentUI):
-                    parent._handle_command()
-                    return
-                parent = parent.parent()
+            if self._agent_ui is not None:
+                self._agent_ui._handle_command()
         else:
             # For all other keys, use default handling
             super().keyPressEvent(event)
@@ -148,55 +154,13 @@ class ChatBubble(QFrame):
         self.setFrameShape(QFrame.NoFrame)
         self.setFrameShadow(QFrame.Plain)
 
-        self.label = QLabel(text, self)
-        self.label.setWordWrap(True)
-        self.label.adjustSize()
-        # Make sure label padding is small:
-        self.label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 13px;
-                padding: 0px;
-            }
-        """)
-
+        # Looks come from app.qss, keyed on this property, so no per-bubble stylesheet parse
+        self.setProperty("bubble", "user" if sender_type == "user" else "assistant")
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
 
-        if sender_type == "user":
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #000000;
-                    border-radius: 8px;
-                    padding: 0px 4px 4px 4px;
-                    margin: 8px 4px 0px 8px;
-                }
-            """)
-            self.label.setStyleSheet("""
-                QLabel {
-                    color: #ffffff;
-                    font-size: 13px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #f5f5f5;
-                    border: 1px solid #f5f5f5;
-                    border-radius: 8px;
-                    padding: 4px;
-                    margin: 0px 0px 0px 8px;
-                }
-            """)
-            self.label.setStyleSheet("""
-                QLabel {
-                    color: #000000;
-                    font-size: 13px;
-                    padding: 0px;
-                }
-            """)
-
+        self.label = QLabel(text, self)
+        self.label.setWordWrap(True)
         layout.addWidget(self.label)
-        self.label.adjustSize()
 
 class ChatLogWidget(QWidget):
     def __init__(self, parent=None):
@@ -210,77 +174,85 @@ class ChatLogWidget(QWidget):
         self.layout.setSpacing(8)  # Space between bubbles
         self.setLayout(self.layout)
 
+        # Running height of all bubbles plus spacing, so appends don't re-walk the layout
+        self._content_height = 0
+
     def add_bubble(self, text, sender_type="assistant"):
+        """Append a bubble; callers batch these and size/scroll the chat log once after"""
         bubble = ChatBubble(text, sender_type=sender_type)
-        
-        container = QWidget()
-        container.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)  # Make container collapse too
-        
-        container_layout = QHBoxLayout(container)
-        container_layout.setContentsMargins(0, 0, 0, 0)  # Match input container margins
-        container_layout.setSpacing(0)
-        
-        if sender_type == "user":
-            container_layout.addStretch()
-            container_layout.addWidget(bubble, 0, Qt.AlignRight)
-            self.layout.addWidget(container)
-        else:
-            container_layout.addWidget(bubble, 0, Qt.AlignLeft)
-            container_layout.addStretch()
-            self.layout.addWidget(container)
+        bubble.setMaximumWidth(self._bubble_max_width())
 
-        # Update sizes after adding content
-        container.adjustSize()
-        self.adjustSize()
-        
-        # Auto-scroll
-        scroll_area = self._get_scroll_area_parent()
-        if scroll_area is not None:
-            scroll_area.widget().adjustSize()
-            # Limit scroll area height to 200
-            content_height = self.sizeHint().height()
-            scroll_area.setFixedHeight(min(content_height, 200))
-            scroll_area.verticalScrollBar().setValue(
-                scroll_area.verticalScrollBar().maximum()
-            )
+        alignment = Qt.AlignRight if sender_type == "user" else Qt.AlignLeft
+        if self.layout.count():
+            self._content_height += self.layout.spacing()
+        self.layout.addWidget(bubble, 0, alignment)
+        self._content_height += bubble.sizeHint().height()
 
-    def _get_scroll_area_parent(self):
-        p = self.parent()
-        while p is not None:
-            if isinstance(p, QScrollArea):
-                return p
-            p = p.parent()
-        return None
+        while self.layout.count() > MAX_CHAT_BUBBLES:
+            self._remove_oldest_bubble()
 
+    def _remove_oldest_bubble(self):
+        oldest = self.layout.takeAt(0).widget()
+        self._content_height -= oldest.sizeHint().height() + self.layout.spacing()
+        oldest.hide()
+        oldest.deleteLater()
 
+    def _bubble_max_width(self):
+        """Bubbles sit directly in the layout, so cap them to keep long text wrapping"""
+        margins = self.layout.contentsMargins()
+        return max(1, self.width() - margins.left() - margins.right())
 
-class ModernButton(QPushButton):
-    """Custom button with hover/click animations"""
-    def __init__(self, text, parent=None, accent_color=QColor("#ff4a4a"), icon=None):
-        super().__init__(text, parent)
-        self.accent_color = accent_color
-        self.setFixedHeight(28)
-        self.setCursor(Qt.PointingHandCursor)
-        if icon:
-            self.setIcon(icon)
+    def content_height(self):
+        """Height needed to show every bubble"""
+        return self._content_height
 
-        self.setStyleSheet(f"""
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.size().width() == event.oldSize().width():
+            return
+        # Wrapping changes with the width, so re-cap the bubbles and re-measure
+        max_width = self._bubble_max_width()
+        heights = []
+        for i in range(self.layout.count()):
+            bubble = self.layout.itemAt(i).widget()
+            bubble.setMaximumWidth(max_width)
+            heights.append(bubble.sizeHint().height())
+        self._content_height = sum(heights) + self.layout.spacing() * max(0, len(heights) - 1)
+
+
+@lru_cache(maxsize=32)
+def _button_qss(rgba: int, font_size: int) -> str:
+    """Accent button stylesheet, formatted once per color and font size"""
+    color = QColor.fromRgba(rgba)
+    return f"""
             QPushButton {{
-                background-color: {accent_color.name()};
+                background-color: {color.name()};
                 border-radius: 14px;
                 color: white;
-                font-size: 14px;
+                font-size: {font_size}px;
                 padding: 1px 10px;
                 border: none;
                 font-weight: 500;
             }}
             QPushButton:hover {{
-                background-color: {QColor(accent_color.lighter(110)).name()};
+                background-color: {color.lighter(110).name()};
             }}
             QPushButton:pressed {{
-                background-color: {QColor(accent_color.darker(110)).name()};
+                background-color: {color.darker(110).name()};
             }}
-        """)
+        """
+
+class ModernButton(QPushButton):
+    """Custom button with hover/click animations"""
+    def __init__(self, text, parent=None, accent_color=QColor("#ff4a4a"), icon=None):
+        super().__init__(text, parent)
+        self.accent_color = accent_color
+        self.setFixedHeight(28)
+        self.setCursor(Qt.PointingHandCursor)
+        if icon:
+            self.setIcon(icon)
+
+        self.setStyleSheet(_button_qss(accent_color.rgba(), 14))
 
 class HoverCursorButton(QPushButton):
     """Forces Qt.PointingHandCursor on hover"""
@@ -296,44 +268,166 @@ class HoverCursorButton(QPushButton):
         self.unsetCursor()
         super().leaveEvent(event)
 
+class AvatarFrameDecoder(QThread):
+    """Decodes an avatar video into the frame cache off the GUI thread"""
+    framesReady = Signal(object, int)  # (N, H, W, 4) frames or None, ms per frame
+
+    def __init__(self, video_path, width, height, mask_alpha, parent=None):
+        super().__init__(parent)
+        self.video_path = video_path
+        self.width = width
+        self.height = height
+        self.mask_alpha = mask_alpha
+
+    def run(self):
+        # cv2 takes a few hundred ms to import and is only needed for video avatars
+        import cv2
+
+        frame_interval = 100
+        rgba = None
+        count = 0
+        # Circle alpha, baked into each frame as it is decoded so painting needs no clip path
+        alpha = self.mask_alpha[:self.height, :self.width]
+        alpha16 = alpha[..., None].astype(np.uint16)
+        cap = cv2.VideoCapture(str(self.video_path))
+        if cap.isOpened():
+            fps = cap.get(cv2.CAP_PROP_FPS) or 10
+            frame_interval = max(1, int(1000 / fps))
+            crop = None  # every frame has the same size, so the crop is computed once
+            # The container's frame count is an estimate; the buffer doubles if it runs short
+            capacity = max(1, int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0) or 64)
+            rgba = np.empty((capacity, self.height, self.width, 4), dtype=np.uint8)
+            try:
+                while not self.isInterruptionRequested():
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    if crop is None:
+                        frame_h, frame_w = frame.shape[:2]
+                        source = CircularAvatarWidget.get_source_rect(
+                            frame_w, frame_h, self.width, self.height
+                        )
+                        crop = (slice(source.y(), source.y() + source.height()),
+                                slice(source.x(), source.x() + source.width()))
+                    frame = cv2.resize(frame[crop], (self.width, self.height),
+                                       interpolation=cv2.INTER_AREA)
+                    if count == len(rgba):
+                        rgba = np.concatenate((rgba, np.empty_like(rgba)))
+                    # Premultiply one frame at a time, so the only uint16 temporary is frame-sized.
+                    # OpenCV decodes BGR; a reversed channel view swaps to RGB in the same pass
+                    out = rgba[count]
+                    out[..., :3] = frame[..., ::-1] * alpha16 // 255
+                    out[..., 3] = alpha
+                    count += 1
+            finally:
+                cap.release()
+
+        if not count or self.isInterruptionRequested():
+            self.framesReady.emit(None, frame_interval)
+            return
+
+        if count < len(rgba):
+            # A slight overestimate is kept as a view; a large one is copied out to free it
+            rgba = rgba[:count] if count * 4 >= len(rgba) * 3 else rgba[:count].copy()
+        self.framesReady.emit(rgba, frame_interval)
+
 class CircularAvatarWidget(QWidget):
     """Circular video/image widget"""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.video_timer = QTimer(self)
-        self.video_timer.timeout.connect(self.update)
-        self.cap = None
+        self.video_timer.timeout.connect(self._next_frame)
         self.static_image = None
         self.is_video = False
+        self._video_path = None
+        self._frames = None  # (N, H, W, 4) premultiplied RGBA frames, pre-cropped to the widget size
+        self._frame_images = []  # QImages wrapping each frame of self._frames without copying
+        self._frame_idx = 0
+        self._frame_interval = 100  # ms per frame, taken from the video's own FPS
+        self._paused = False
+        self._decoder = None  # decoder whose result is still wanted
+        self._decoders = set()  # keeps running decoder threads alive until they finish
+
+        # Circle alpha mask and masked static image, rebuilt only when the size changes
+        self._mask = None
+        self._mask_alpha = None
+        self._static_cache = None
+        self._border_pen = QPen()
+        self._border_pen.setWidth(2)
+        self.set_accent_color("#ff4a4a")
         
         # Add loading eyes
         self.loading_eyes = LoadingEyesWidget(self)
 
-    def get_resize_dimensions(self, frame_width, frame_height, target_width, target_height):
-        """Calculate dimensions that maintain aspect ratio while filling the target area"""
+    @staticmethod
+    def get_source_rect(frame_width, frame_height, target_width, target_height):
+        """Centered region of the frame with the target's aspect ratio (crop-to-fill)"""
         frame_aspect = frame_width / frame_height
         target_aspect = target_width / target_height
         
         if frame_aspect > target_aspect:
-            # Frame is wider than target: fit to height
-            new_height = target_height
-            new_width = int(target_height * frame_aspect)
-            x_offset = (new_width - target_width) // 2
+            # Frame is wider than target: keep full height, crop the sides
+            src_height = frame_height
+            src_width = int(frame_height * target_aspect)
+            x_offset = (frame_width - src_width) // 2
             y_offset = 0
         else:
-            # Frame is taller than target: fit to width
-            new_width = target_width
-            new_height = int(target_width / frame_aspect)
+            # Frame is taller than target: keep full width, crop top and bottom
+            src_width = frame_width
+            src_height = int(frame_width / target_aspect)
             x_offset = 0
-            y_offset = (new_height - target_height) // 2
+            y_offset = (frame_height - src_height) // 2
             
-        return new_width, new_height, x_offset, y_offset
+        return QRect(x_offset, y_offset, src_width, src_height)
+
+    def set_accent_color(self, color):
+        """Set the border color (accent at low alpha)"""
+        self._border_pen.setColor(QColor(QColor(color).name() + "20"))
+        self.update()
+
+    def _ensure_mask(self):
+        """Build the antialiased circle mask for the current size, once"""
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        if self._mask is not None and self._mask.size() == self.size():
+            return
+        self._mask = QImage(self.size(), QImage.Format_ARGB32_Premultiplied)
+        self._mask.fill(Qt.transparent)
+        mask_painter = QPainter(self._mask)
+        mask_painter.setRenderHint(QPainter.Antialiasing)
+        mask_painter.setPen(Qt.NoPen)
+        mask_painter.setBrush(Qt.white)
+        mask_painter.drawEllipse(self._mask.rect())
+        mask_painter.end()
+
+        # Alpha channel as an (H, W) array for masking video frames with numpy
+        bits = np.frombuffer(self._mask.constBits(), dtype=np.uint8)
+        bits = bits.reshape(self._mask.height(), self._mask.bytesPerLine() // 4, 4)
+        alpha_index = 3 if sys.byteorder == 'little' else 0  # ARGB32 is native-endian
+        self._mask_alpha = bits[:, :self._mask.width(), alpha_index].copy()
+        self._static_cache = None
+
+    def _build_static_cache(self):
+        """Scale the static image and cut it to the circle once"""
+        self._ensure_mask()
+        scaled = self.static_image.scaled(
+            self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        cache = QImage(self.size(), QImage.Format_ARGB32_Premultiplied)
+        cache.fill(Qt.transparent)
+        cache_painter = QPainter(cache)
+        cache_painter.drawImage(cache.rect(), scaled)
+        cache_painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+        cache_painter.drawImage(0, 0, self._mask)
+        cache_painter.end()
+        self._static_cache = cache
 
     def set_image(self, image_path):
         """Set static image avatar"""
         self.stop_video()
         self.is_video = False
         self.static_image = QImage(image_path)
+        self._static_cache = None
         self.update()
 
     def start_video(self, video_path):
@@ -342,23 +436,98 @@ class CircularAvatarWidget(QWidget):
         
         if Path(video_path).exists():
             self.logger.info(f"Starting video from: {video_path}")
+            self.stop_video()
             self.static_image = None
             self.is_video = True
-            self.cap = cv2.VideoCapture(str(video_path))
-            if not self.cap.isOpened():
-                self.logger.error(f"Failed to open video file: {video_path}")
-                return
-            self.video_timer.start(100)
+            self._video_path = video_path
+            self._start_decoder()
         else:
             self.logger.error(f"Video file not found: {video_path}")
 
+    def _start_decoder(self):
+        """Decode the current video for the current size in a background thread"""
+        self._ensure_mask()
+        if self._mask_alpha is None:
+            return
+        if self._decoder is not None:
+            self._decoder.requestInterruption()
+        decoder = AvatarFrameDecoder(
+            self._video_path, self.width(), self.height(), self._mask_alpha, self
+        )
+        decoder.framesReady.connect(self._on_frames_decoded)
+        decoder.finished.connect(self._on_decoder_finished)
+        self._decoder = decoder
+        self._decoders.add(decoder)
+        decoder.start(QThread.LowPriority)
+
+    @Slot(object, int)
+    def _on_frames_decoded(self, frames, frame_interval):
+        """Swap in a finished frame cache, unless a newer decode superseded it"""
+        if self.sender() is not self._decoder:
+            return
+        self._decoder = None
+        if frames is None:
+            self.logger.error(f"Failed to open video file: {self._video_path}")
+            return
+        self._frames = frames
+        # Wrap each frame once; the images borrow self._frames, which stays alive with them
+        self._frame_images = [
+            QImage(frame.data, frame.shape[1], frame.shape[0],
+                   frame.strides[0], QImage.Format_RGBA8888_Premultiplied)
+            for frame in frames
+        ]
+        self._frame_interval = frame_interval
+        self._frame_idx = 0
+        self.video_timer.stop()
+        self._update_timer()
+        self.update()
+        if frames.shape[1:3] != (self.height(), self.width()):
+            # Resized while decoding: show these frames until the right size is ready
+            self._start_decoder()
+
+    @Slot()
+    def _on_decoder_finished(self):
+        decoder = self.sender()
+        self._decoders.discard(decoder)
+        decoder.deleteLater()
+
     def stop_video(self):
         """Stop video playback"""
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        if self._decoder is not None:
+            self._decoder.requestInterruption()
+            self._decoder = None
+        self._frame_images = []
+        self._frames = None
+        self._video_path = None
         self.video_timer.stop()
 
+    def _update_timer(self):
+        """Run the frame timer only while there is a visible, unpaused video"""
+        if self._frames is not None and self.isVisible() and not self._paused:
+            if not self.video_timer.isActive():
+                self.video_timer.start(self._frame_interval)
+        else:
+            self.video_timer.stop()
+
+    def set_paused(self, paused: bool):
+        """Pause/resume video playback, e.g. while the application is hidden"""
+        self._paused = paused
+        self._update_timer()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_timer()
+
+    def hideEvent(self, event):
+        self.video_timer.stop()
+        super().hideEvent(event)
+
+    def _next_frame(self):
+        """Advance to the next cached frame, looping at the end"""
+        if self._frames is not None:
+            self._frame_idx = (self._frame_idx + 1) % len(self._frames)
+            self.update()
+
     def set_loading(self, is_loading: bool):
         """Toggle loading state"""
         self.loading_eyes.set_loading(is_loading)
@@ -366,52 +535,26 @@ class CircularAvatarWidget(QWidget):
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.loading_eyes.update_positions()
+        # Cached frames and mask are pre-scaled; rebuild them for the new size
+        self._ensure_mask()
+        if self._frames is not None and self._frames.shape[1:3] != (self.height(), self.width()):
+            self._start_decoder()
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
 
-        path = QPainterPath()
-        path.addEllipse(self.rect())
-        painter.setClipPath(path)
-
-        if self.is_video and self.cap:
-            ret, frame = self.cap.read()
-            if ret:
-                # Loop if at end
-                if self.cap.get(cv2.CAP_PROP_POS_FRAMES) == self.cap.get(cv2.CAP_PROP_FRAME_COUNT):
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                
-                # Get frame dimensions that preserve aspect ratio
-                frame_h, frame_w = frame.shape[:2]
-                new_w, new_h, x_off, y_off = self.get_resize_dimensions(
-                    frame_w, frame_h, 
-                    self.width(), self.height()
-                )
-                
-                # Resize frame maintaining aspect ratio
-                frame = cv2.resize(frame, (new_w, new_h))
-                
-                # Crop to target size
-                frame = frame[y_off:y_off+self.height(), x_off:x_off+self.width()]
-                
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                image = QImage(frame.data, frame.shape[1], frame.shape[0],
-                             frame.strides[0], QImage.Format_RGB888)
-                painter.drawImage(self.rect(), image)
+        if self.is_video and self._frames is not None:
+            # Frames are already cropped, scaled and masked, so this is a straight blit
+            painter.drawImage(0, 0, self._frame_images[self._frame_idx])
                 
         elif self.static_image:
-            scaled = self.static_image.scaled(
-                self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            painter.drawImage(self.rect(), scaled)
+            if self._static_cache is None or self._static_cache.size() != self.size():
+                self._build_static_cache()
+            painter.drawImage(0, 0, self._static_cache)
 
         # Draw border
-        pen = QPen()
-        pen.setWidth(2)
-        accent_color = QColor(self.parent().accent_color) if hasattr(self.parent(), 'accent_color') else QColor("#ff4a4a")
-        pen.setColor(QColor(accent_color.name() + "20"))
-        painter.setPen(pen)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._border_pen)
         painter.drawEllipse(self.rect().adjusted(1, 1, -1, -1))
 
 class AgentUI(QMainWindow):
@@ -419,6 +562,11 @@ class AgentUI(QMainWindow):
 
     # ADD A LOG SIGNAL HERE:
     logMessageSignal = Signal(dict)
+    # Lets background loops toggle the avatar's loading state on the UI thread
+    avatarLoadingSignal = Signal(bool)
+
+    # Accent color -> stylesheets, shared across windows
+    _style_cache = {}
     
     def __init__(
         self, 
@@ -451,9 +599,10 @@ class AgentUI(QMainWindow):
         
         initial_avatar = next(iter(self.avatar_manager._avatars.values()))
         self.accent_color = initial_avatar.accent_color if initial_avatar else "#ff4a4a"
+        self._accent_qcolor = QColor(self.accent_color)  # parsed once per accent change
 
         # Initialize core features
-        self.voice_handler = VoiceHandler(config, self.avatar_manager)
+        self.voice_handler = VoiceHandler(config, self.avatar_manager, voice_loop=self.voice_loop)
         self.crypto_analyzer = CryptoAnalyzer(config)
         self.screenshot_handler = screenshot_handler or ScreenshotHandler()
         self.screenshot_analyzer = screenshot_analyzer
@@ -464,6 +613,10 @@ class AgentUI(QMainWindow):
         self.avatar_manager.add_observer(self.voice_handler)
         self.avatar_manager.add_observer(self.crypto_analyzer)
 
+        # Warm the DexScreener connection in the background so the first lookup is fast
+        if self.voice_loop and self.voice_loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.crypto_analyzer.warmup(), self.voice_loop)
+
         self.command_accelerator = GeneralCommandAccelerator(config)
 
         # Setup event loop
@@ -499,15 +652,12 @@ class AgentUI(QMainWindow):
             if self.voice_loop and self.voice_loop.is_running():
                 self.logger.info("Starting narrative processor in voice loop...")
                 try:
-                    fut = asyncio.run_coroutine_threadsafe(
+                    # process_queue never returns, so there is nothing to wait for
+                    asyncio.run_coroutine_threadsafe(
                         self.command_manager.process_queue(),
                         self.voice_loop
                     )
-                    try:
-                        fut.result(timeout=5)
-                    except asyncio.TimeoutError:
-                        self.logger.warning("Command queue did not confirm within 5s.")
-                    self.logger.info("Command manager queue started.")
+                    self.logger.info("Command manager queue scheduled.")
                 except Exception as e:
                     self.logger.error(f"Failed to start command queue: {e}", exc_info=True)
             else:
@@ -516,26 +666,42 @@ class AgentUI(QMainWindow):
         self.command_active = False
         self.command_state = UICommandState.READY
         self._drag_pos = None
+        self._is_hidden = False  # Window taken off screen for a screenshot
 
         self.voice_command_handler = VoiceCommandHandler(config)
+        # Warm the handler's HTTP/2 connection on the loop that will use it
+        if self.loop and self.loop.is_running():
+            asyncio.ensure_future(self.voice_command_handler.warmup(), loop=self.loop)
 
         # Create a signal bus for background->main updates
         self.command_signal_bus = UICommandSignalBus()
-        self.command_signal_bus.commandUpdated.connect(self._on_command_update_main_thread)
+        self.command_signal_bus.commandUpdatesPending.connect(self._schedule_command_drain)
+
+        # Command updates from the manager thread, drained at most once per frame
+        self._pending_ctx = []
+        self._pending_ctx_lock = threading.Lock()
+        self._ctx_timer = QTimer(self)
+        self._ctx_timer.setSingleShot(True)
+        self._ctx_timer.timeout.connect(self._drain_command_updates)
 
         # Connect logMessageSignal -> a slot to update logs on main thread
         self.logMessageSignal.connect(self._on_new_log_message)
 
+        # Log bursts are queued and flushed as one batch of bubbles
+        self._pending_logs = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_logs)
+
         # Start manager queue if no voice_loop or if fallback
         if self.voice_loop and self.voice_loop.is_running():
             self.logger.info("Starting command manager on voice_loop...")
             try:
-                fut = asyncio.run_coroutine_threadsafe(
+                asyncio.run_coroutine_threadsafe(
                     self.command_manager.process_queue(),
                     self.voice_loop
                 )
-                fut.result(timeout=1)
-                self.logger.info("Command manager queue started (voice_loop).")
+                self.logger.info("Command manager queue scheduled (voice_loop).")
             except Exception as e:
                 self.logger.error(f"Failed to start manager queue: {e}")
         else:
@@ -547,6 +713,7 @@ class AgentUI(QMainWindow):
 
         # Initialize UI first
         self.init_ui()
+        self.avatarLoadingSignal.connect(self.avatar_widget.set_loading)
 
         # Now set up the avatar after UI is initialized
         if initial_avatar:
@@ -560,14 +727,39 @@ class AgentUI(QMainWindow):
             self._handle_classification_with_original
         )
 
+        # Stop animating the avatar while the whole application is hidden
+        app = QApplication.instance()
+        if app:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+
+    @Slot(Qt.ApplicationState)
+    def _on_application_state_changed(self, state):
+        hidden = state in (Qt.ApplicationHidden, Qt.ApplicationSuspended)
+        self.avatar_widget.set_paused(hidden)
+
     # ------------------- NEW SLOT FOR LOG MESSAGES -------------------
     @Slot(dict)
     def _on_new_log_message(self, new_log: dict):
         """
         Called on the main/UI thread whenever self.logMessageSignal.emit(...) 
-        is triggered from a background thread. We now add a chat bubble.
+        is triggered from a background thread. Bubbles are added in batches
+        so a burst of logs costs a single relayout.
         """
-        self._append_chat_bubble(new_log)
+        self._pending_logs.append(new_log)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(50)
+
+    def _flush_logs(self):
+        """Add every queued log bubble, then size and scroll the chat log once"""
+        pending, self._pending_logs = self._pending_logs, []
+        if not pending:
+            return
+        # No setUpdatesEnabled() bracket: nothing paints until this slot returns,
+        # and re-enabling would repaint every old bubble. New bubbles schedule
+        # paints for their own rects only.
+        for log in pending:
+            self._add_chat_bubble(log)
+        self._refresh_chat_log()
 
     # ----------------------------------------------------------------
 
@@ -595,12 +787,12 @@ class AgentUI(QMainWindow):
             try:
                 asyncio.set_event_loop(cleanup_loop)
                 
-                # Cleanup voice command handler
-                if hasattr(self, 'voice_command_handler') and self.voice_loop and self.voice_loop.is_running():
+                # Cleanup voice command handler (it runs on the main loop)
+                if hasattr(self, 'voice_command_handler') and self.loop and self.loop.is_running():
                     try:
                         fut = asyncio.run_coroutine_threadsafe(
                             self.voice_command_handler.close(),
-                            self.voice_loop
+                            self.loop
                         )
                         fut.result(timeout=2)
                     except Exception as e:
@@ -649,11 +841,12 @@ class AgentUI(QMainWindow):
             finally:
                 cleanup_loop.close()
                 
-        cleanup_thread = threading.Thread(target=cleanup_background, daemon=True)
-        cleanup_thread.start()
-        cleanup_thread.join(timeout=0.5)
-                
-        self.logger.info("UI cleanup completed")
+        # Don't join: closing the window shouldn't wait on network teardown, and
+        # the handler closes scheduled on self.loop need this thread free anyway
+        self._cleanup_thread = threading.Thread(target=cleanup_background, daemon=True)
+        self._cleanup_thread.start()
+
+        self.logger.info("UI cleanup dispatched")
 
     def closeEvent(self, event):
         self.logger.info("Close event received")
@@ -676,12 +869,6 @@ class AgentUI(QMainWindow):
             self.logger.error(f"Error during cleanup/close: {str(e)}")
             self.close()
 
-    def _get_icons(self):
-        return {
-            'close': "✕",
-            'send': "➚"
-        }
-
     def _handle_key_press(self, event):
         if event.key() == Qt.Key_Return and not event.modifiers() & Qt.ShiftModifier:
             event.accept()
@@ -692,40 +879,17 @@ class AgentUI(QMainWindow):
     def focusOutEvent(self, event):
         super().focusOutEvent(event)
 
-    def _update_accent_colors(self, color: str):
-        self.accent_color = color
-        button_style = f"""
-            QPushButton {{
-                background-color: {color};
-                border-radius: 14px;
-                color: white;
-                font-size: 10px;
-                padding: 1px 10px;
-                border: none;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {QColor(color).lighter(110).name()};
-            }}
-            QPushButton:pressed {{
-                background-color: {QColor(color).darker(110).name()};
-            }}
-        """
-        # Update accent colors for all buttons
-        self.region_button.accent_color = QColor(color)
-        self.skills_button.accent_color = QColor(color)
-        self.fullscreen_button.accent_color = QColor(color)
-        self.voice_button.accent_color = QColor(color)
-        self.voice_button._setup_styling()
-        self.avatar_widget.loading_eyes.update_accent_color(QColor(color))
-        
-        # Apply styles
-        self.region_button.setStyleSheet(button_style)
-        self.fullscreen_button.setStyleSheet(button_style)
-        self.skills_button.setStyleSheet(button_style)
-        
-        # Update randomize button border color
-        self.randomize_btn.setStyleSheet(f"""
+    @classmethod
+    def _accent_styles(cls, color: str):
+        """Stylesheets for an accent color, built once per color"""
+        styles = cls._style_cache.get(color)
+        if styles is not None:
+            return styles
+
+        lighter = QColor(color).lighter(110).name()
+        styles = {
+            'button': _button_qss(QColor(color).rgba(), 10),
+            'randomize': f"""
             QPushButton {{
                 background-color: transparent;
                 border: 1px solid {color};
@@ -738,31 +902,49 @@ class AgentUI(QMainWindow):
                 margin: 0;
             }}
             QPushButton:hover {{
-                background-color: {QColor(color).lighter(110).name()};
+                background-color: {lighter};
             }}
-        """)
-
-        self.send_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #000000;
-                border-radius: 8px;
+        """,
+            # Only the accent-colored glyph; the rest of the send button lives in app.qss
+            'send': f"""
+            QPushButton#sendButton[state="ready"] {{
                 color: {color};
-                font-size: 20px;
-                border: none;
-                padding: 0;
-                margin: 0;
-                text-align: center;
-            }}
-            QPushButton:hover {{
-                background-color: #111111;
             }}
-        """)
+        """,
+        }
+        cls._style_cache[color] = styles
+        return styles
 
-        self.avatar_widget.update()
+    def _update_accent_colors(self, color: str):
+        self.accent_color = color
+        self._accent_qcolor = QColor(color)
+        styles = self._accent_styles(color)
+        accent = self._accent_qcolor
+
+        self.setUpdatesEnabled(False)
+        try:
+            # Update accent colors for all buttons
+            self.region_button.accent_color = accent
+            self.skills_button.accent_color = accent
+            self.fullscreen_button.accent_color = accent
+            self.voice_button.accent_color = accent
+            self.voice_button._setup_styling()
+            self.avatar_widget.loading_eyes.update_accent_color(accent)
+            self.avatar_widget.set_accent_color(color)
+
+            # Apply styles
+            self.region_button.setStyleSheet(styles['button'])
+            self.fullscreen_button.setStyleSheet(styles['button'])
+            self.skills_button.setStyleSheet(styles['button'])
+
+            # Update randomize button border color
+            self.randomize_btn.setStyleSheet(styles['randomize'])
+            self._apply_send_button_accent()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def init_ui(self):
         self.resize(WINDOW_WIDTH, WINDOW_HEIGHT)
-        icons = self._get_icons()
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -772,13 +954,7 @@ class AgentUI(QMainWindow):
         main_layout.setSpacing(0)
 
         self.main_frame = QFrame()
-        self.main_frame.setStyleSheet("""
-            QFrame {
-                background-color: #0A0A0A;
-                border: 1px solid rgba(75, 75, 75, 0.3);
-                border-radius: 12px;
-            }
-        """)
+        self.main_frame.setObjectName("mainFrame")
         frame_layout = QVBoxLayout(self.main_frame)
         frame_layout.setContentsMargins(0, 0, 0, 0)
         frame_layout.setSpacing(0)
@@ -786,14 +962,7 @@ class AgentUI(QMainWindow):
         # Header
         header = QWidget()
         header.setFixedHeight(48)
-        header.setStyleSheet("""
-            QWidget {
-                background-color: #000000;
-                border-top-left-radius: 12px;
-                border-top-right-radius: 12px;
-                border-bottom: 1px solid rgba(75, 75, 75, 0.3);
-            }
-        """)
+        header.setObjectName("header")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(16, 0, 16, 0)
         header_layout.setSpacing(4)
@@ -815,37 +984,20 @@ class AgentUI(QMainWindow):
                 margin: 0;
             }}
             QPushButton:hover {{
-                background-color: {QColor(self.accent_color).name() + "1A"};
+                background-color: {self._accent_qcolor.name() + "1A"};
             }}
         """)
         randomize_btn.clicked.connect(self.randomize_avatar)
 
         self.name_label = QLabel("Gennifer")
-        self.name_label.setStyleSheet("""
-            color: #e0e0e0;
-            font-size: 13px;
-            font-weight: 500;
-            margin-left: 2px;
-            border: none;
-        """)
+        self.name_label.setObjectName("nameLabel")
 
         button_size = 32
 
-        self.close_btn = HoverCursorButton(icons['close'])
+        self.close_btn = HoverCursorButton(ICONS['close'])
         self.close_btn.setFixedSize(button_size, button_size)
         self.close_btn.clicked.connect(self.cleanup_and_close)
-        self.close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border-radius: 8px;
-                color: #666666;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #ff4a4a;
-                color: white;
-            }
-        """)
+        self.close_btn.setObjectName("closeButton")
 
         header_layout.addWidget(randomize_btn)
         header_layout.addWidget(self.name_label)
@@ -855,18 +1007,7 @@ class AgentUI(QMainWindow):
         self.mute_btn = HoverCursorButton("🔊")
         self.mute_btn.setFixedSize(button_size, button_size)
         self.mute_btn.clicked.connect(self._toggle_mute)
-        self.mute_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border-radius: 8px;
-                color: #666666;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #ff4a4a;
-                color: white;
-            }
-        """)
+        self.mute_btn.setObjectName("muteButton")
 
         header_layout.addWidget(self.mute_btn)
         header_layout.addWidget(self.close_btn)
@@ -905,27 +1046,19 @@ class AgentUI(QMainWindow):
         region_layout.addWidget(self.region_button)
 
         # Add the new star button in the middle
-        self.skills_button = ModernButton("⭐", accent_color=QColor(self.accent_color))
+        self.skills_button = ModernButton("⭐", accent_color=self._accent_qcolor)
         self.skills_button.setFixedWidth(40)  # Make it compact
         self.skills_button.clicked.connect(self._toggle_skills_menu)
         region_layout.addWidget(self.skills_button)
 
         region_layout.addWidget(self.fullscreen_button)
 
-        # Initialize the skills menu
-        self._setup_skills_menu()
+        # The skills menu is built on first open (_toggle_skills_menu)
+        self.skills_menu = None
 
         # Input container
         input_container = QWidget()
-        input_container.setStyleSheet("""
-            QWidget {
-                background-color: #ffffff;
-                border-radius: 12px;
-                margin: 8px 16px 16px 12px;
-                padding: 8px 4px 4px 4px;
-                
-            }
-        """)
+        input_container.setObjectName("inputContainer")
         input_layout = QVBoxLayout(input_container)
         input_layout.setContentsMargins(12, 0, 12, 12)
         input_layout.setSpacing(0)
@@ -938,25 +1071,25 @@ class AgentUI(QMainWindow):
         # NEW: Scroll area + ChatLogWidget replaces the old self.log_view
         self.chat_scroll_area = QScrollArea()
         self.chat_scroll_area.setWidgetResizable(True)
-        self.chat_scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;;
-                border: none;
-                padding: 0px;
-                margin: 8px 0px 0px 0px;
-            }
-        """)
+        self.chat_scroll_area.setObjectName("chatScrollArea")
         self.chat_scroll_area.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
         self.chat_scroll_area.setMaximumHeight(200)  # Set maximum height
         self.chat_scroll_area.setFixedHeight(0)  # Start collapsed
         self.chat_scroll_area.hide()
 
+        # Follow new bubbles as soon as the layout grows the scroll range,
+        # unless the user has scrolled up to read
+        self._autoscroll = True
+        chat_scroll_bar = self.chat_scroll_area.verticalScrollBar()
+        chat_scroll_bar.valueChanged.connect(self._on_chat_scrolled)
+        chat_scroll_bar.rangeChanged.connect(self._on_chat_range_changed)
+
         # Create the ChatLogWidget and set it as the scroll area's widget
-        self.chat_log_widget = ChatLogWidget()  # Add this line
+        self.chat_log_widget = ChatLogWidget()
         self.chat_scroll_area.setWidget(self.chat_log_widget)
 
         # Create input widget
-        self.command_input = CommandInputWidget()
+        self.command_input = CommandInputWidget(agent_ui=self)
 
         input_overlay = QWidget()
         input_overlay.setStyleSheet("background: transparent;")
@@ -965,12 +1098,7 @@ class AgentUI(QMainWindow):
         overlay_layout.setSpacing(8)
         overlay_layout.addStretch()
 
-        default_accent = "#ff4a4a"
-        try:
-            button_accent = self.accent_color if hasattr(self, 'accent_color') else default_accent
-            self.voice_button = VoiceCommandButton(accent_color=QColor(button_accent))
-        except:
-            self.voice_button = VoiceCommandButton(accent_color=QColor(default_accent))
+        self.voice_button = VoiceCommandButton(accent_color=self._accent_qcolor)
 
         self.voice_button.clicked.connect(self._toggle_voice_command)
         self.voice_button.recordingStarted.connect(self._start_voice_recording)
@@ -978,24 +1106,12 @@ class AgentUI(QMainWindow):
         self.voice_button.transcriptionComplete.connect(self._handle_transcription)
         self.voice_command_handler.set_voice_button(self.voice_button)
 
-        self.send_button = HoverCursorButton(self._get_icons()['send'])
+        self.send_button = HoverCursorButton(ICONS['send'])
         self.send_button.setFixedSize(36, 36)
         self.send_button.clicked.connect(self._handle_command)
-        self.send_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #000000;
-                border-radius: 8px;
-                color: {self.accent_color};
-                font-size: 20px;
-                border: none;
-                padding: 0;
-                margin: 0;
-                text-align: center;
-            }}
-            QPushButton:hover {{
-                background-color: #111111;
-            }}
-        """)
+        self.send_button.setObjectName("sendButton")
+        self.send_button.setProperty("state", "ready")
+        self._apply_send_button_accent()
 
         overlay_layout.addWidget(self.voice_button, alignment=Qt.AlignRight | Qt.AlignBottom)
         overlay_layout.addWidget(self.send_button, alignment=Qt.AlignRight | Qt.AlignBottom)
@@ -1015,9 +1131,25 @@ class AgentUI(QMainWindow):
         main_layout.addWidget(self.main_frame)
 
     def _on_command_update(self, ctx: CMContext):
-        """Called by manager from a background thread -> forward to main thread."""
-        self.logger.debug(f"_on_command_update() from background: {ctx.state}")
-        self.command_signal_bus.commandUpdated.emit(ctx)
+        """Called by manager from a background thread -> batched to the main thread."""
+        self.logger.debug("_on_command_update() from background: %s", ctx.state)
+        with self._pending_ctx_lock:
+            self._pending_ctx.append(ctx)
+            if len(self._pending_ctx) > 1:
+                return  # the main thread has already been woken for this batch
+        self.command_signal_bus.commandUpdatesPending.emit()
+
+    @Slot()
+    def _schedule_command_drain(self):
+        if not self._ctx_timer.isActive():
+            self._ctx_timer.start(16)
+
+    def _drain_command_updates(self):
+        """Handle every command update queued since the last frame"""
+        with self._pending_ctx_lock:
+            batch, self._pending_ctx = self._pending_ctx, []
+        for ctx in batch:
+            self._on_command_update_main_thread(ctx)
 
     def _store_initial_geometry(self):
         """
@@ -1127,37 +1259,23 @@ class AgentUI(QMainWindow):
             }
         """)
         
-        skills_layout = QVBoxLayout(content_widget)
-        skills_layout.setContentsMargins(12, 12, 12, 12)
-        skills_layout.setSpacing(8)
+        self._skills_layout = QVBoxLayout(content_widget)
+        self._skills_layout.setContentsMargins(12, 12, 12, 12)
+        self._skills_layout.setSpacing(8)
 
-        # Get current avatar's skills
-        current_avatar = self.avatar_manager.get_current_avatar()
-        skills = current_avatar.skills if current_avatar else []
-
-        # If no skills, show a message
-        if not skills:
-            skill_label = QLabel("No skills available")
-            skill_label.setStyleSheet("""
-                QLabel {
-                    color: #666666;
-                    font-size: 13px;
-                    padding: 4px;
-                }
-            """)
-            skills_layout.addWidget(skill_label)
-        else:
-            # Add each skill
-            for skill in skills:
-                skill_label = QLabel(f"{skill}")
-                skill_label.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 13px;
-                        padding: 4px;
-                    }
-                """)
-                skills_layout.addWidget(skill_label)
+        # Shown in place of the list when the avatar has no skills
+        self._no_skills_label = QLabel("No skills available")
+        self._no_skills_label.setStyleSheet("""
+            QLabel {
+                color: #666666;
+                font-size: 13px;
+                padding: 4px;
+            }
+        """)
+        self._skills_layout.addWidget(self._no_skills_label)
+
+        # Skill labels are reused across avatars; _refresh_skills adds more as needed
+        self._skill_labels = []
 
         # Add the sections to main layout
         main_layout.addWidget(header)
@@ -1172,8 +1290,42 @@ class AgentUI(QMainWindow):
             }
         """)
 
+        # Get current avatar's skills
+        current_avatar = self.avatar_manager.get_current_avatar()
+        self._refresh_skills(current_avatar.skills if current_avatar else [])
+
+    def _refresh_skills(self, skills):
+        """Show the given skills in the menu, reusing the existing labels"""
+        # Hold off repaints until every label is in place
+        self.skills_menu.setUpdatesEnabled(False)
+        try:
+            while len(self._skill_labels) < len(skills):
+                skill_label = QLabel()
+                skill_label.setStyleSheet("""
+                    QLabel {
+                        color: white;
+                        font-size: 13px;
+                        padding: 4px;
+                    }
+                """)
+                self._skills_layout.addWidget(skill_label)
+                self._skill_labels.append(skill_label)
+
+            for i, skill_label in enumerate(self._skill_labels):
+                if i < len(skills):
+                    skill_label.setText(f"{skills[i]}")
+                    skill_label.show()
+                else:
+                    skill_label.hide()
+            self._no_skills_label.setVisible(not skills)
+        finally:
+            self.skills_menu.setUpdatesEnabled(True)
+
     def _toggle_skills_menu(self):
         """Show/hide the skills menu"""
+        if self.skills_menu is None:
+            self._setup_skills_menu()
+
         if self.skills_menu.isVisible():
             self.skills_menu.hide()
         else:
@@ -1202,7 +1354,8 @@ class AgentUI(QMainWindow):
         avatar = self.avatar_manager.get_current_avatar()
         self.name_label.setText(avatar.name)
         self._update_accent_colors(avatar.accent_color)
-        self._setup_skills_menu()  # Refresh skills menu for new avatar
+        if self.skills_menu is not None:
+            self._refresh_skills(avatar.skills)  # Refresh skills menu for new avatar
 
     def _send_command(self):
         if self.command_active:
@@ -1227,25 +1380,18 @@ class AgentUI(QMainWindow):
             # Set minimum width to ensure proper word wrapping
             self.chat_log_widget.setMinimumWidth(200)
             
-            # Animate window expansion
+            # Grow the window in one step: animating geometry relaid out every
+            # child on each frame, and only the chat area actually changes
             if self._original_geometry is not None:
                 cur_rect = self.geometry()
                 orig_rect = self._original_geometry
                 new_h = int(orig_rect.height() * 1.5)
-
-                self.resize_animation = QPropertyAnimation(self, b"geometry")
-                self.resize_animation.setDuration(300)
-                self.resize_animation.setEasingCurve(QEasingCurve.OutQuad)
-
-                new_rect = QRect(
+                self.setGeometry(QRect(
                     cur_rect.x(),
-                    cur_rect.y(), 
+                    cur_rect.y(),
                     cur_rect.width(),
                     new_h
-                )
-                self.resize_animation.setStartValue(cur_rect)
-                self.resize_animation.setEndValue(new_rect)
-                self.resize_animation.start()
+                ))
 
             # Mark the UI as expanded
             self.ui_expanded = True
@@ -1254,21 +1400,8 @@ class AgentUI(QMainWindow):
         self.avatar_widget.set_loading(True)
         self.command_active = True
         self.command_state = UICommandState.RUNNING
-        self.send_button.setText(self._get_icons()['close'])
-        self.send_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff4a4a;
-                border-radius: 8px;
-                color: #000000;
-                font-size: 18px;
-                border: none;
-                padding: 0;
-                margin: 0;
-            }
-            QPushButton:hover {
-                background-color: #ff6b6b;
-            }
-        """)
+        self.send_button.setText(ICONS['close'])
+        self._set_send_button_state("running")
 
         async def add_cmd():
             enhanced_command = await self.command_accelerator.enhance_command(command)
@@ -1323,7 +1456,15 @@ class AgentUI(QMainWindow):
     def _append_chat_bubble(self, log: dict):
         """
         log: {'type': 'command' or 'response', 'content': '...'}
+
+        Queued behind any pending log bubbles and flushed on the next event
+        loop turn, so back-to-back appends share one relayout.
         """
+        self._pending_logs.append(log)
+        self._flush_timer.start(0)
+
+    def _add_chat_bubble(self, log: dict):
+        """Add the bubble for one log entry without resizing the scroll area"""
         if log['type'] == 'command':
             # "command" means user bubble
             self.chat_log_widget.add_bubble(log['content'], sender_type="user")
@@ -1338,56 +1479,76 @@ class AgentUI(QMainWindow):
                     formatted += f"\nTool Use:{parts[1]}"
                 text = formatted
             self.chat_log_widget.add_bubble(text, sender_type="assistant")
-        
+
+    def _refresh_chat_log(self):
+        """Fit the chat scroll area to its bubbles and scroll to the newest one"""
         # After adding any bubble, ensure scroll area is properly sized
         self.chat_scroll_area.show()
         
-        # Force complete layout update 
+        # One layout pass; the scroll below waits for Qt to apply it
         self.chat_log_widget.adjustSize()
-        self.chat_scroll_area.adjustSize()
-        self.chat_scroll_area.updateGeometry()
-        QApplication.processEvents()
-        
+
         # Get actual height needed
-        container_height = sum(self.chat_log_widget.layout.itemAt(i).widget().sizeHint().height() 
-                            for i in range(self.chat_log_widget.layout.count()))
+        container_height = self.chat_log_widget.content_height()
         scroll_height = min(container_height + 20, 200)  # Add buffer but respect max height
         
-        # Update scroll area height
+        # Update scroll area height; _on_chat_range_changed scrolls to the bottom
         self.chat_scroll_area.setFixedHeight(scroll_height)
-        
-        # Add delayed scroll to bottom
-        QTimer.singleShot(50, lambda: self.chat_scroll_area.verticalScrollBar().setValue(
-            self.chat_scroll_area.verticalScrollBar().maximum()
-        ))
+
+    @Slot(int)
+    def _on_chat_scrolled(self, value):
+        self._autoscroll = value >= self.chat_scroll_area.verticalScrollBar().maximum()
+
+    @Slot(int, int)
+    def _on_chat_range_changed(self, _minimum, maximum):
+        if self._autoscroll:
+            self.chat_scroll_area.verticalScrollBar().setValue(maximum)
+
+    def _apply_send_button_accent(self):
+        """Give the send glyph the accent color; the one-rule sheet changes only with the accent"""
+        self.send_button.setStyleSheet(self._accent_styles(self.accent_color)['send'])
+
+    def _set_send_button_state(self, state: str):
+        """Switch the send button's look by re-polishing, without a new stylesheet"""
+        self.send_button.setProperty("state", state)
+        style = self.send_button.style()
+        style.unpolish(self.send_button)
+        style.polish(self.send_button)
 
     def _reset_command_ui(self):
         self.command_active = False
         self.command_state = UICommandState.READY
         
         # Reset send button
-        self.send_button.setText(self._get_icons()['send'])
-        self.send_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #000000;
-                border-radius: 8px;
-                color: {self.accent_color};
-                font-size: 20px;
-                border: none;
-                padding: 0;
-                margin: 0;
-                text-align: center;
-            }}
-            QPushButton:hover {{
-                background-color: #111111;
-            }}
-        """)
+        self.send_button.setText(ICONS['send'])
+        self._set_send_button_state("ready")
         self.avatar_widget.set_loading(False)
 
-    def _take_region_screenshot(self):
+    def _hide_for_capture(self):
+        """Take the window off screen for a capture; False if one is already underway"""
+        if self._is_hidden:
+            return False
+        self._is_hidden = True
         self.hide()
         self.lower()
-        time.sleep(0.1)
+        return True
+
+    def _show_after_capture(self):
+        if not self._is_hidden:
+            return
+        self._is_hidden = False
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def _take_region_screenshot(self):
+        if not self._hide_for_capture():
+            return
+        # Give the window manager time to take the window off screen without
+        # blocking the event loop, then capture
+        QTimer.singleShot(SCREENSHOT_HIDE_DELAY_MS, self._capture_region_now)
+
+    def _capture_region_now(self):
         try:
             self.command_active = False
             self.command_state = UICommandState.READY
@@ -1399,35 +1560,34 @@ class AgentUI(QMainWindow):
             self.logger.error(f"Screenshot error: {str(e)}")
             self.avatar_widget.set_loading(False)
         finally:
-            self.show()
-            self.raise_()
-            self.activateWindow()
+            self._show_after_capture()
 
     def _take_fullscreen_screenshot(self):
-        self.hide()
-        self.lower()
-        time.sleep(0.1)
+        if not self._hide_for_capture():
+            return
+        QTimer.singleShot(SCREENSHOT_HIDE_DELAY_MS, self._capture_fullscreen_now)
+
+    def _capture_fullscreen_now(self):
         try:
             self.avatar_widget.set_loading(True)
             screenshot = self.screenshot_handler.capture_full_screen()
             if screenshot:
                 self._process_screenshot(screenshot)
         finally:
-            self.show()
-            self.raise_()
-            self.activateWindow()
+            self._show_after_capture()
 
     def _process_screenshot(self, image):
-        if not hasattr(self, '_thread_pool'):
-            self._thread_pool = []
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        def run_analysis():
-            loop.run_until_complete(self._analyze_screenshot(image))
-        thread = threading.Thread(target=run_analysis)
-        self._thread_pool.append(thread)
-        thread.start()
+        # Analysis runs on the voice loop (where the DEX session and TTS already
+        # live) instead of a fresh thread and event loop per screenshot
+        if self.voice_loop and self.voice_loop.is_running():
+            loop = self.voice_loop
+        elif self.loop and self.loop.is_running():
+            loop = self.loop
+        else:
+            self.logger.error("No running loop for screenshot analysis")
+            self.avatar_widget.set_loading(False)
+            return
+        asyncio.run_coroutine_threadsafe(self._analyze_screenshot(image), loop)
 
     async def _analyze_screenshot(self, image):
         try:
@@ -1445,25 +1605,31 @@ class AgentUI(QMainWindow):
             else:
                 analysis = await self.crypto_analyzer.analyze_image(image)
                 if analysis:
-                    # Add an assistant bubble with analysis text
-                    self._append_chat_bubble({'type': 'response', 'content': analysis})
+                    # Add an assistant bubble with analysis text (queued to the UI thread)
+                    self.logMessageSignal.emit({'type': 'response', 'content': analysis})
                     self.voice_handler.generate_and_play_background(analysis)
         except Exception as e:
             self.logger.error(f"Analysis error: {str(e)}")
         finally:
-            self.avatar_widget.set_loading(False)
+            self.avatarLoadingSignal.emit(False)
 
     def _toggle_voice_command(self):
         self.logger.debug("Voice button clicked")
-        if self.voice_loop:
-            self.voice_button.is_recording = not self.voice_button.is_recording
-            if self.voice_button.is_recording:
-                asyncio.run_coroutine_threadsafe(self._start_voice_recording(), self.voice_loop)
-            else:
-                asyncio.run_coroutine_threadsafe(self._stop_voice_recording(), self.voice_loop)
-            self.voice_button._setup_styling()
+        # Voice commands run on the UI thread's (qasync) loop; fall back to voice_loop
+        if self.loop and self.loop.is_running():
+            submit = lambda coro: asyncio.ensure_future(coro, loop=self.loop)
+        elif self.voice_loop:
+            submit = lambda coro: asyncio.run_coroutine_threadsafe(coro, self.voice_loop)
         else:
-            self.logger.error("No voice_loop available for toggling voice command")
+            self.logger.error("No event loop available for toggling voice command")
+            return
+
+        self.voice_button.is_recording = not self.voice_button.is_recording
+        if self.voice_button.is_recording:
+            submit(self._start_voice_recording())
+        else:
+            submit(self._stop_voice_recording())
+        self.voice_button._setup_styling()
 
     async def _start_voice_recording(self):
         try:
@@ -1549,7 +1715,7 @@ class AgentUI(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
-    app.setStyleSheet("""
+    app.setStyleSheet(load_app_stylesheet() + """
         * {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
         }
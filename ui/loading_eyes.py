@@ -1,24 +1,15 @@
 import math
-import random
-from collections import namedtuple
 
-from PySide6.QtCore import Qt, QTimer, QPointF
+import numpy as np
+from PySide6.QtCore import Qt, QTimer, QPointF, QRect
 from PySide6.QtWidgets import QWidget
 from PySide6.QtGui import (
     QPainter, QColor, QPen, QBrush, QPainterPath,
-    QRadialGradient
+    QRadialGradient, QPixmap, QPixmapCache, QRegion
 )
 
-Ring = namedtuple(
-    "Ring",
-    [
-        "angle",     # Current rotation angle
-        "radius",    # Ring radius
-        "width",     # Line width
-        "alpha",     # Opacity
-        "speed"      # Rotation speed
-    ]
-)
+# Degrees covered by each ring's arc
+ARC_LENGTH = 140
 
 class LaserEyeEffect(QWidget):
     """
@@ -27,17 +18,20 @@ class LaserEyeEffect(QWidget):
     """
     def __init__(self, parent=None, accent_color=QColor("#ff4a4a")):
         super().__init__(parent)
-        self.setVisible(False)
         self.accent_color = accent_color
         
-        # Ring configuration
-        self.rings = []
+        # Ring configuration, one array entry per ring
         self.initialize_rings()
+        # Angles as of the last repaint; ticks that move less than a pixel skip it
+        self._painted_angles = self.angles.copy()
         
-        # Animation timer
+        # Animation timer, only running while the effect is shown. Created before
+        # setVisible below, which already delivers a hideEvent that stops it
         self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update)
-        self.animation_timer.start(16)  # ~60 FPS
+        self.animation_timer.setInterval(16)  # ~60 FPS
+        self.animation_timer.timeout.connect(self._tick)
+
+        self.setVisible(False)
 
     def initialize_rings(self):
         """Initialize the rotating rings with different properties."""
@@ -46,86 +40,145 @@ class LaserEyeEffect(QWidget):
         base_widths = [7, 9, 11]  # Wider for more coverage
         base_alphas = [255, 255, 255]  # Further increased opacity
         
-        self.rings = [
-            Ring(
-                angle=i * (360 / 3),
-                radius=rad,
-                width=width,
-                alpha=alpha,
-                speed=speed
-            )
-            for i, (speed, rad, width, alpha) in enumerate(
-                zip(base_speeds, base_radii, base_widths, base_alphas)
-            )
-        ]
+        # Struct-of-arrays so a tick advances every ring in one vector op
+        self.angles = np.arange(len(base_speeds)) * (360 / 3)  # Current rotation angles
+        self.radii = np.array(base_radii)    # Ring radius, as a fraction of the circle
+        self.widths = np.array(base_widths)  # Line width
+        self.alphas = np.array(base_alphas)  # Opacity
+        self.speeds = np.array(base_speeds)  # Rotation speed, degrees per tick
+
+    def _arc_rect(self, i, start, span):
+        """Widget-space bounding rect of ring i's arc from start over span degrees"""
+        w, h = self.width(), self.height()
+        radius = self.radii[i] * min(w, h) / 2
+        cx, cy = w / 2, h / 2
+
+        # The extremes are at the end points and any axis crossings in between
+        end = start + span
+        angles = [start, end] + [a for a in range(0, 720, 90) if start < a < end]
+        xs = [cx + radius * math.cos(math.radians(a)) for a in angles]
+        ys = [cy - radius * math.sin(math.radians(a)) for a in angles]
+
+        pad = self.widths[i] / 2 + 1  # pen half-width plus antialiasing
+        left, top = math.floor(min(xs) - pad), math.floor(min(ys) - pad)
+        right, bottom = math.ceil(max(xs) + pad), math.ceil(max(ys) + pad)
+        return QRect(left, top, right - left, bottom - top)
+
+    def _tick(self):
+        """Advance the rings; repaint only the swept area, and only once it moved a pixel"""
+        self.angles += self.speeds
+        self.angles %= 360
+
+        # Largest distance any ring's arc has travelled since the last repaint
+        outer_radius = min(self.width(), self.height()) / 2 * self.devicePixelRatioF()
+        swept = (self.angles - self._painted_angles) % 360
+        if (np.radians(swept) * self.radii).max() * outer_radius < 1:
+            return
+
+        region = QRegion()
+        for i, (painted, deg) in enumerate(zip(self._painted_angles, swept)):
+            # Old arc starts at the painted angle, the new one deg later: one span covers both
+            region = region.united(QRegion(self._arc_rect(i, painted, ARC_LENGTH + deg)))
+        self._painted_angles[:] = self.angles
+        self.update(region)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.animation_timer.start()
+
+    def hideEvent(self, event):
+        self.animation_timer.stop()
+        super().hideEvent(event)
 
     def set_accent_color(self, color: QColor):
         """Update the accent color"""
         self.accent_color = color
         self.update()
 
-    def paintEvent(self, event):
-        if not self.isVisible():
-            return
+    def _render_layer(self, min_dim, draw):
+        """Transparent min_dim square clipped to the circle, painted by draw(painter, center)"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(min_dim * dpr), int(min_dim * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
 
-        painter = QPainter(self)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
+        center = QPointF(min_dim / 2, min_dim / 2)
+        clip_path = QPainterPath()
+        clip_path.addEllipse(center, min_dim / 2, min_dim / 2)
+        painter.setClipPath(clip_path)
+        draw(painter, center, clip_path)
+        painter.end()
+        return pixmap
+
+    def _layers(self, min_dim):
+        """
+        Background glow plus one arc per ring (drawn at angle 0), rendered once
+        per size/color/DPR and kept in QPixmapCache; frames just rotate them.
+        """
+        base_key = f"laser_eyes/{min_dim}/{self.accent_color.rgba()}/{self.devicePixelRatioF()}"
+        red, green, blue = self.accent_color.red(), self.accent_color.green(), self.accent_color.blue()
+
+        def cached(key, draw):
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None or pixmap.isNull():
+                pixmap = self._render_layer(min_dim, draw)
+                QPixmapCache.insert(key, pixmap)
+            return pixmap
+
+        def draw_glow(painter, center, clip_path):
+            # Background glow (more opaque)
+            bg_gradient = QRadialGradient(center, min_dim / 2)
+            bg_gradient.setColorAt(0, QColor(red, green, blue, 30))
+            bg_gradient.setColorAt(1, QColor(red, green, blue, 0))
+            painter.fillPath(clip_path, QBrush(bg_gradient))
+
+        def draw_arc(i):
+            def draw(painter, center, clip_path):
+                current_radius = self.radii[i] * (min_dim / 2)
+                pen = QPen()
+                pen.setWidth(int(self.widths[i]))
+                pen.setColor(QColor(red, green, blue, int(self.alphas[i])))
+                pen.setCapStyle(Qt.RoundCap)
+                painter.setPen(pen)
+                painter.drawArc(
+                    int(center.x() - current_radius),
+                    int(center.y() - current_radius),
+                    int(current_radius * 2),
+                    int(current_radius * 2),
+                    0,
+                    ARC_LENGTH * 16  # Qt uses 16ths of a degree
+                )
+            return draw
 
+        glow = cached(f"{base_key}/glow", draw_glow)
+        arcs = [cached(f"{base_key}/ring{i}", draw_arc(i)) for i in range(len(self.angles))]
+        return glow, arcs
+
+    def paintEvent(self, event):
         w = self.width()
         h = self.height()
         min_dim = min(w, h)
-        center = QPointF(w/2, h/2)
+        if min_dim <= 0:
+            return
+        glow, arcs = self._layers(min_dim)
 
-        # Create clip path
-        clip_path = QPainterPath()
-        clip_path.addEllipse(center, min_dim/2, min_dim/2)
-        painter.setClipPath(clip_path)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.translate(w / 2, h / 2)
+        corner = QPointF(-min_dim / 2, -min_dim / 2)
+        painter.drawPixmap(corner, glow)
 
-        # Draw background glow (more opaque)
-        bg_gradient = QRadialGradient(center, min_dim/2)
-        bg_gradient.setColorAt(0, QColor(self.accent_color.red(), 
-                                       self.accent_color.green(), 
-                                       self.accent_color.blue(), 30))
-        bg_gradient.setColorAt(1, QColor(self.accent_color.red(), 
-                                       self.accent_color.green(), 
-                                       self.accent_color.blue(), 0))
-        painter.fillPath(clip_path, QBrush(bg_gradient))
-
-        # Update and draw rings
-        updated_rings = []
-        for ring in self.rings:
-            # Update angle
-            new_angle = (ring.angle + ring.speed) % 360
-            
-            # Calculate ring properties
-            current_radius = ring.radius * (min_dim/2)
-            
-            # Draw ring with higher opacity using accent color
-            pen = QPen()
-            pen.setWidth(ring.width)
-            pen.setColor(QColor(self.accent_color.red(), 
-                              self.accent_color.green(), 
-                              self.accent_color.blue(), 
-                              ring.alpha))
-            pen.setCapStyle(Qt.RoundCap)
-            painter.setPen(pen)
-            
-            # Draw arc segments with increased length
-            arc_length = 140  # degrees - increased for more coverage
-            start_angle = new_angle * 16  # Qt uses 16ths of a degree
-            painter.drawArc(
-                int(center.x() - current_radius),
-                int(center.y() - current_radius),
-                int(current_radius * 2),
-                int(current_radius * 2),
-                start_angle,
-                arc_length * 16
-            )
-            
-            # Store updated ring
-            updated_rings.append(ring._replace(angle=new_angle))
-        
-        self.rings = updated_rings
+        # Draw rings at their current angles (_tick advances them); Qt clips
+        # all of this to the region that was invalidated
+        self._painted_angles[:] = self.angles
+        for angle, arc in zip(self.angles, arcs):
+            # drawArc angles run counter-clockwise, painter rotation clockwise
+            painter.save()
+            painter.rotate(-angle)
+            painter.drawPixmap(corner, arc)
+            painter.restore()
 
 class LoadingEyesWidget:
     """
@@ -140,7 +193,7 @@ class LoadingEyesWidget:
         self.update_positions()
 
     def set_loading(self, is_loading: bool):
-        """Enable or disable the loading effect."""
+        """Enable or disable the loading effect (its timer runs only while shown)."""
         self.is_loading = is_loading
         self.orb.setVisible(is_loading)
 
@@ -1,14 +1,24 @@
 from PySide6.QtWidgets import (QWidget, QLabel, QVBoxLayout, QHBoxLayout, 
     QFrame, QApplication, QPushButton)
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QRect, QPoint, Signal, QObject
-from PySide6.QtGui import QColor, QPainter, QPainterPath, QFont
+from PySide6.QtCore import (Qt, QPropertyAnimation, QRect, QPoint, Property,
+    Slot, QMetaObject)
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QFont, QPixmap, QPixmapCache
 import platform
+import threading
 import time
+from functools import lru_cache
 
+# How long a notification stays up while its progress bar fills
+NOTIFICATION_DURATION_MS = 20000
+
+# Resolved once at import; platform.system() may shell out to uname
+_IS_DARWIN = platform.system() == "Darwin"
+
+@lru_cache(maxsize=1)
 def get_display_scaling():
-    """Get display scaling factor safely."""
+    """Get display scaling factor safely (constant per process, so computed once)."""
     try:
-        if platform.system() == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
             from AppKit import NSScreen
             return NSScreen.mainScreen().backingScaleFactor()
         return 1.0
@@ -18,22 +28,34 @@ def get_display_scaling():
 class ProgressBar(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.value = 0
+        self._value = 0
+        self._bar_width = 0
+        self._bar_color = QColor("#ff4a4a")
         self.setFixedHeight(2)
         self.setStyleSheet("background-color: transparent;")
-        
-        self.bar = QFrame(self)
-        self.bar.setStyleSheet("background-color: #ff4a4a;")
-        self.bar.setFixedHeight(2)
-        
+
+    def getValue(self):
+        return self._value
+
     def setValue(self, value):
-        self.value = value
+        self._value = value
         width = int((value / 100.0) * self.width())
-        self.bar.setFixedWidth(width)
+        # Animation steps land well inside one pixel; only repaint the strip that changed
+        if width != self._bar_width:
+            left = min(width, self._bar_width)
+            self.update(QRect(left, 0, max(width, self._bar_width) - left, self.height()))
+            self._bar_width = width
 
-class NotificationBridge(QObject):
-    """Bridge for thread-safe notification signals"""
-    show_message_signal = Signal(str)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bar_width = int((self._value / 100.0) * self.width())
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(0, 0, self._bar_width, self.height(), self._bar_color)
+
+    # Animatable so QPropertyAnimation can drive the countdown
+    value = Property(float, getValue, setValue)
 
 class NotificationWindow(QWidget):
     def __init__(self, parent):
@@ -45,20 +67,20 @@ class NotificationWindow(QWidget):
         self.setAttribute(Qt.WA_ShowWithoutActivating)
         
         self.scaling_factor = get_display_scaling()
-        
-        self.animation_active = False
-        self.current_progress = 0
-        self.progress_timer = QTimer(self)
-        self.progress_timer.timeout.connect(self._update_progress_bar)
-        
-        self.hide_timer = QTimer(self)
-        self.hide_timer.setSingleShot(True)
-        self.hide_timer.timeout.connect(self._force_hide)
-        
-        self.bridge = NotificationBridge()
-        self.bridge.show_message_signal.connect(self._show_message_impl)
+        self._font_size = None  # Font size the message label's stylesheet was built for
+
+        # Latest message waiting for the GUI thread; a burst coalesces into one show
+        self._pending_message = None
+        self._pending_lock = threading.Lock()
         
         self.initUI()
+
+        # Progress bar countdown; the notification hides when it completes
+        self.progress_animation = QPropertyAnimation(self.progress_bar, b"value", self)
+        self.progress_animation.setDuration(NOTIFICATION_DURATION_MS)
+        self.progress_animation.setStartValue(0.0)
+        self.progress_animation.setEndValue(100.0)
+        self.progress_animation.finished.connect(self._force_hide)
         
     def initUI(self):
         # Main layout
@@ -112,46 +134,74 @@ class NotificationWindow(QWidget):
         )
         super().resizeEvent(event)
         
+    def _background(self):
+        """Rounded-rect background, rasterized once per size/DPR and kept in QPixmapCache"""
+        dpr = self.devicePixelRatioF()
+        key = f"notification_bg/{self.width()}x{self.height()}/{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            path = QPainterPath()
+            path.addRoundedRect(
+                self.rect(), 
+                12,  # Fixed 12px radius
+                12
+            )
+            painter.fillPath(path, QColor(0, 0, 0, 245))
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        path = QPainterPath()
-        path.addRoundedRect(
-            self.rect(), 
-            12,  # Fixed 12px radius
-            12
-        )
-        
-        painter.fillPath(path, QColor(0, 0, 0, 245))
+        painter.drawPixmap(0, 0, self._background())
 
     def show_message(self, message):
-        self.bridge.show_message_signal.emit(message)
-        
+        """Thread-safe; the work is queued onto the window's (GUI) thread"""
+        with self._pending_lock:
+            already_queued = self._pending_message is not None
+            self._pending_message = message
+        if not already_queued:
+            QMetaObject.invokeMethod(self, "_show_pending_message", Qt.QueuedConnection)
+
+    @Slot()
+    def _show_pending_message(self):
+        """Show only the newest message queued since the last GUI tick"""
+        with self._pending_lock:
+            message, self._pending_message = self._pending_message, None
+        if message is not None:
+            self._show_message_impl(message)
+
     def _show_message_impl(self, message):
         try:
-            self.hide_timer.stop()
-            self.progress_timer.stop()
+            self.progress_animation.stop()
             
             parent_pos = self.parent.pos()
             parent_width = self.parent.width()
             
-            # Set max width to parent width
+            # Max width is the parent width (enforced by setFixedSize below)
             max_width = parent_width
-            self.setMaximumWidth(max_width)
             
             # Dynamic font size based on content with larger base size
             font_size = max(13, min(int(max_width * 0.04), 15))
-            self.message_label.setStyleSheet(f"""
-                color: white;
-                font-size: {font_size}px;
-                line-height: 1.4;
-                background-color: transparent;
-                padding-top: 2px;
-            """)
-            
+            # Re-setting a stylesheet re-parses it and re-polishes the label; skip when unchanged
+            if font_size != self._font_size:
+                self.message_label.setStyleSheet(f"""
+                    color: white;
+                    font-size: {font_size}px;
+                    line-height: 1.4;
+                    background-color: transparent;
+                    padding-top: 2px;
+                """)
+                self._font_size = font_size
+            
+            # Only measure the label here; the window's single setFixedSize lays it out
             self.message_label.setText(message)
-            self.message_label.adjustSize()
             
             # Set message width constraint
             message_width = self.message_label.sizeHint().width()
@@ -172,37 +222,20 @@ class NotificationWindow(QWidget):
             self.setFixedSize(final_width, final_height)
             self.move(x, y)
             
-            self.animation_active = True
-            self.current_progress = 0
             self.progress_bar.setValue(0)
             
             self.show()
             self.raise_()
             
-            self.progress_timer.start(50)
-            self.hide_timer.start(20000)
+            self.progress_animation.start()
             
         except Exception as e:
             print(f"Error showing notification: {str(e)}")
             self.show()
             
-    def _update_progress_bar(self):
-        if not self.animation_active:
-            return
-            
-        self.current_progress += 0.25
-        self.progress_bar.setValue(min(self.current_progress, 100))
-        
-        if self.current_progress >= 100:
-            self.progress_timer.stop()
-            self._force_hide()
-            
+    @Slot()
     def _force_hide(self):
-        self.hide_timer.stop()
-        self.progress_timer.stop()
-        
-        self.animation_active = False
-        self.current_progress = 0
+        self.progress_animation.stop()
         self.progress_bar.setValue(0)
         
         self.close()